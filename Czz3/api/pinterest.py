@@ -2,8 +2,6 @@
 Pinterest API - Video pin creation integration
 """
 
-import requests
-import json
 import os
 from typing import Optional, Dict
 
@@ -11,6 +9,10 @@ class PinterestAPI:
     """Pinterest API v5 integration for creating video pins"""
     
     def __init__(self, access_token: str):
+        # Load requests on first use so folder scanning doesn't pay its import cost
+        global requests
+        import requests
+        
         self.access_token = access_token
         self.base_url = "https://api.pinterest.com/v5"
         
@@ -24,6 +26,9 @@ class PinterestAPI:
         self.product_tags = ['80817', '64237', '83349', '26803', '25007']
         self.shop_link = "https://www.cavemantrainingc.com/shop"
         
+        # Product metadata is identical for every pin, so build it once
+        self.product_metadata = {'product_ids': self.product_tags} if self.product_tags else None
+        
     def test_connection(self) -> bool:
         """Test API credentials and connection"""
         try:
@@ -121,10 +126,8 @@ class PinterestAPI:
                 pin_data['board_id'] = board_id
                 
             # Add product tags
-            if self.product_tags:
-                pin_data['product_rich_metadata'] = {
-                    'product_ids': self.product_tags
-                }
+            if self.product_metadata:
+                pin_data['product_rich_metadata'] = self.product_metadata
                 
             # Create the pin
             url = f"{self.base_url}/pins"
@@ -4,20 +4,30 @@ File Manager - Handles file scanning, validation, and metadata extraction
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
-from dataclasses import dataclass
 
-@dataclass
 class FileInfo:
-    """Data class for file information"""
-    path: str
-    filename: str
-    folder_type: str  # 'cloudflare', 'pinterest', 'youtube_shorts'
-    title: str
-    description: str
-    short_description: str
-    platforms: List[str]  # Which platforms this file should be uploaded to
+    """Slotted record for file information"""
+    __slots__ = ('path', 'filename', 'folder_type', 'title', 'description',
+                 'short_description', 'platforms', 'size')
+    
+    def __init__(self, path: str, filename: str, folder_type: str, title: str,
+                 description: str, short_description: str, platforms: List[str],
+                 size: int = 0):
+        self.path = path
+        self.filename = filename
+        self.folder_type = folder_type  # 'cloudflare', 'pinterest', 'youtube_shorts'
+        self.title = title
+        self.description = description
+        self.short_description = short_description
+        self.platforms = platforms  # Which platforms this file should be uploaded to
+        self.size = size
+        
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"FileInfo({fields})"
     
 class FileManager:
     """Manages file scanning and validation for video uploads"""
@@ -37,21 +47,20 @@ class FileManager:
         """Scan all three folders for video files and return file info objects"""
         all_files = []
         
-        # Scan CloudFlare folder
-        if self.cloudflare_path.exists():
-            cf_files = self._scan_folder(self.cloudflare_path, 'cloudflare')
-            all_files.extend(cf_files)
-            
-        # Scan Pinterest folder
-        if self.pinterest_path.exists():
-            pin_files = self._scan_folder(self.pinterest_path, 'pinterest')
-            all_files.extend(pin_files)
-            
-        # Scan YouTube Shorts folder
-        if self.youtube_shorts_path.exists():
-            yt_files = self._scan_folder(self.youtube_shorts_path, 'youtube_shorts')
-            all_files.extend(yt_files)
-            
+        folders = [
+            (folder_path, folder_type)
+            for folder_path, folder_type in ((self.cloudflare_path, 'cloudflare'),
+                                             (self.pinterest_path, 'pinterest'),
+                                             (self.youtube_shorts_path, 'youtube_shorts'))
+            if folder_path.exists()
+        ]
+        
+        # The folders are independent trees, so walk them at the same time
+        if folders:
+            with ThreadPoolExecutor(max_workers=len(folders)) as executor:
+                for files in executor.map(lambda folder: self._scan_folder(*folder), folders):
+                    all_files.extend(files)
+                    
         return self.validate_files(all_files)
         
     def _scan_folder(self, folder_path: Path, folder_type: str) -> List[FileInfo]:
@@ -146,6 +155,7 @@ class FileManager:
                 if file_size == 0:
                     print(f"Skipping empty file: {file_info.filename}")
                     continue
+                file_info.size = file_size
                     
                 validated_files.append(file_info)
                 
@@ -3,20 +3,68 @@ Folder Watcher - Real-time folder monitoring for video file detection
 """
 
 import os
+import sys
 import time
+import heapq
+import logging
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
+log = logging.getLogger(__name__)
+
+DRIVE_REMOTE = 4  # GetDriveTypeW result for network drives
+
+def is_network_path(path):
+    """Check whether a path lives on a network share (Windows only)"""
+    if sys.platform != 'win32':
+        return False
+    try:
+        import ctypes
+        drive, _ = os.path.splitdrive(os.path.abspath(path))
+        if drive.startswith('\\\\'):
+            return True  # UNC path (\\server\share)
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == DRIVE_REMOTE
+    except Exception:
+        return False
+
+# Metadata text files that sit next to each video
+SIDECAR_SUFFIXES = ('_TITLE.txt', '_DESCRIPTION.txt', '_SHORT_DESC.txt')
+
 class VideoFileHandler(FileSystemEventHandler):
     """Handles file system events for video files"""
     
-    def __init__(self, callback, valid_extensions=None):
+    def __init__(self, callback, valid_extensions=None, sidecar_callback=None):
         self.callback = callback
+        self.sidecar_callback = sidecar_callback  # Called with the path of new/changed text files
         self.valid_extensions = valid_extensions or ['.mov', '.mp4', '.avi', '.mkv', '.m4v', '.wmv']
-        self.processing_files = set()  # Track files being processed
-        self.file_timers = {}  # Track file modification timers
+        self._ext_set = frozenset(ext.lower() for ext in self.valid_extensions)
+        # Track files being processed: path -> time added. Bounded LRU with a TTL
+        # so entries that never get marked processed can't pile up forever
+        self.processing_files = OrderedDict()
+        self.max_processing_files = 10000
+        self.processing_ttl = 3600.0
+        self.pending_checks = {}  # path -> deadline of its live stability check
+        self._last_stat = {}  # path -> (size, mtime_ns) seen at the last check
+        self._lock = threading.Lock()  # Guards all of the state above plus the heap
+        
+        # Single scheduler thread for stability checks instead of a Timer per file.
+        # Heap entries whose deadline no longer matches pending_checks are stale.
+        self._sched_cv = threading.Condition(self._lock)
+        self._heap = []  # (deadline, path, delay)
+        self._scheduler_thread = None
+        self._scheduler_stop = None  # Stop event of the current scheduler thread, one per start
+        
+        # The callback runs on its own worker so a slow one can't hold up stability checks
+        self._callback_executor = None
+        
+        # Stability check delays (seconds) - doubles while the file keeps changing
+        self.stability_delay = 3.0
+        self.max_stability_delay = 12.0
         
     def on_created(self, event):
         """Handle file creation events"""
@@ -28,63 +76,189 @@ class VideoFileHandler(FileSystemEventHandler):
         if not event.is_directory:
             self.handle_file_event(event.src_path, 'modified')
     
+    def on_moved(self, event):
+        """Handle files renamed into place (common for atomic saves)"""
+        if not event.is_directory:
+            self.handle_file_event(event.dest_path, 'moved')
+    
     def handle_file_event(self, file_path, event_type):
         """Process file system events for video files"""
-        # Check if it's a video file
-        if not any(file_path.lower().endswith(ext) for ext in self.valid_extensions):
+        # Text files only need passing on, there's nothing to wait for
+        if self.sidecar_callback and file_path.endswith(SIDECAR_SUFFIXES):
+            self.sidecar_callback(file_path)
             return
             
-        # Avoid processing the same file multiple times
-        if file_path in self.processing_files:
+        # Check if it's a video file (only the suffix is lowercased)
+        dot = file_path.rfind('.')
+        if dot == -1 or file_path[dot:].lower() not in self._ext_set:
             return
             
-        # Cancel any existing timer for this file
-        if file_path in self.file_timers:
-            self.file_timers[file_path].cancel()
+        # Remember the file's current size/mtime to compare against later
+        stat = self._stat_file(file_path)
         
-        # Set a timer to process the file after it's stable (not being written to)
-        timer = threading.Timer(3.0, self.process_stable_file, args=[file_path])
-        self.file_timers[file_path] = timer
-        timer.start()
+        with self._lock:
+            # Avoid processing the same file multiple times
+            if self._is_processing(file_path):
+                return
+                
+            if stat is None:
+                self._last_stat.pop(file_path, None)
+            else:
+                self._last_stat[file_path] = stat
+            
+            # Check the file once it's stable (not being written to);
+            # this replaces any check already pending for it
+            self._schedule_stability_check(file_path, self.stability_delay)
     
-    def process_stable_file(self, file_path):
+    def _is_processing(self, file_path):
+        """Check if a file is still being processed, expiring stale entries (lock held)"""
+        added = self.processing_files.get(file_path)
+        if added is None:
+            return False
+        if time.monotonic() - added > self.processing_ttl:
+            del self.processing_files[file_path]
+            return False
+        return True
+    
+    def _add_processing(self, file_path):
+        """Record a file as being processed, evicting the oldest entry if full (lock held)"""
+        self.processing_files[file_path] = time.monotonic()
+        self.processing_files.move_to_end(file_path)
+        if len(self.processing_files) > self.max_processing_files:
+            self.processing_files.popitem(last=False)
+    
+    def _schedule_stability_check(self, file_path, delay):
+        """Queue a stability check for the file after the given delay (lock held)"""
+        deadline = time.monotonic() + delay
+        self.pending_checks[file_path] = deadline
+        heapq.heappush(self._heap, (deadline, file_path, delay))
+        self._sched_cv.notify()
+    
+    def start_scheduler(self):
+        """Start the background thread that runs due stability checks"""
+        with self._lock:
+            if self._scheduler_stop is not None:
+                return
+            stop = self._scheduler_stop = threading.Event()
+            self._scheduler_thread = threading.Thread(target=self._run_scheduler, args=(stop,), daemon=True)
+        self._scheduler_thread.start()
+    
+    def stop_scheduler(self):
+        """Stop the scheduler thread and drop any pending checks"""
+        with self._lock:
+            if self._scheduler_stop is not None:
+                self._scheduler_stop.set()
+                self._scheduler_stop = None
+            thread, self._scheduler_thread = self._scheduler_thread, None
+            executor, self._callback_executor = self._callback_executor, None
+            self._heap.clear()
+            self.pending_checks.clear()
+            self._sched_cv.notify_all()
+        # The thread exits on its own stop event, so a quick restart can't leave two running
+        if thread:
+            thread.join(timeout=1)
+        if executor:
+            executor.shutdown(wait=False)
+    
+    def _run_scheduler(self, stop):
+        """Pop due checks off the heap and process them until stop is set"""
+        with self._sched_cv:
+            while not stop.is_set():
+                if not self._heap:
+                    self._sched_cv.wait()
+                    continue
+                    
+                deadline, file_path, delay = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._sched_cv.wait(timeout=remaining)
+                    continue
+                    
+                heapq.heappop(self._heap)
+                if self.pending_checks.get(file_path) != deadline:
+                    continue  # Superseded by a newer event
+                del self.pending_checks[file_path]
+                
+                # Run the check without holding the lock
+                self._sched_cv.release()
+                try:
+                    self.process_stable_file(file_path, delay)
+                finally:
+                    self._sched_cv.acquire()
+    
+    def process_stable_file(self, file_path, delay=None):
         """Process file after it's been stable for a few seconds"""
         try:
-            # Remove from timers
-            if file_path in self.file_timers:
-                del self.file_timers[file_path]
+            stat = self._stat_file(file_path)
+            
+            with self._lock:
+                # Check if file is complete (not being written to)
+                is_complete = self._check_complete(file_path, stat)
+                if is_complete:
+                    self._last_stat.pop(file_path, None)
+                    self._add_processing(file_path)
+                    if self._callback_executor is None:
+                        self._callback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="watcher-callback")
+                    executor = self._callback_executor
+                elif file_path in self._last_stat:
+                    # Still being written - check again later with backoff
+                    next_delay = min((delay or self.stability_delay) * 2, self.max_stability_delay)
+                    self._schedule_stability_check(file_path, next_delay)
             
-            # Check if file is complete (not being written to)
-            if self.is_file_complete(file_path):
-                self.processing_files.add(file_path)
-                self.callback(file_path)
+            if is_complete:
+                executor.submit(self._run_callback, file_path)
         except Exception as e:
-            print(f"Error processing file {file_path}: {e}")
+            log.error("Error processing file %s: %s", file_path, e)
+            
+    def _run_callback(self, file_path):
+        """Run the file callback on the callback worker, logging any error"""
+        try:
+            self.callback(file_path)
+        except Exception as e:
+            log.error("Error processing file %s: %s", file_path, e)
     
-    def is_file_complete(self, file_path):
-        """Check if file is completely written (not being modified)"""
+    def _stat_file(self, file_path):
+        """Return the file's (size, mtime_ns) or None if it can't be read"""
         try:
-            # Try to get file size twice with a small delay
-            size1 = os.path.getsize(file_path)
-            time.sleep(1)
-            size2 = os.path.getsize(file_path)
-            
-            # File is complete if size hasn't changed and size > 0
-            return size1 == size2 and size1 > 0
-        except (OSError, FileNotFoundError):
+            st = os.stat(file_path)
+            return (st.st_size, st.st_mtime_ns)
+        except OSError:
+            return None
+    
+    def _check_complete(self, file_path, current):
+        """Compare a fresh stat against the recorded one and update it (lock held)"""
+        if current is None:
+            self._last_stat.pop(file_path, None)
+            return False
+        
+        previous = self._last_stat.get(file_path)
+        if current == previous and current[0] == 0:
+            # Settled but empty - wait for the next write event instead of polling
+            self._last_stat.pop(file_path, None)
             return False
+        self._last_stat[file_path] = current
+        
+        # File is complete if size/mtime haven't changed and size > 0
+        return current == previous
+    
+    def is_file_complete(self, file_path):
+        """Check if file is completely written (unchanged since the last recorded stat)"""
+        stat = self._stat_file(file_path)
+        with self._lock:
+            return self._check_complete(file_path, stat)
     
     def mark_file_processed(self, file_path):
         """Mark file as processed to avoid reprocessing"""
-        self.processing_files.discard(file_path)
+        with self._lock:
+            self.processing_files.pop(file_path, None)
 
 class FolderWatcher:
     """Main folder watcher class that monitors video file folders"""
     
-    def __init__(self, base_path, file_callback):
+    def __init__(self, base_path, file_callback, force_polling=False, sidecar_callback=None):
         self.base_path = base_path
         self.file_callback = file_callback
-        self.observer = Observer()
+        self.sidecar_callback = sidecar_callback
         self.is_watching = False
         
         # Paths to watch - these match your folder structure
@@ -94,8 +268,26 @@ class FolderWatcher:
             os.path.join(base_path, "YouTube Shorts")
         ]
         
+        # Native observers drop events on network shares, so poll those instead
+        self.use_polling = force_polling or is_network_path(base_path)
+        if self.use_polling:
+            self.observer = PollingObserver(timeout=1.0)
+        else:
+            self.observer = Observer()
+        
+        # Top-level folder name -> folder type
+        self._base = Path(base_path)
+        self._folder_map = {
+            "CloudFlare": "cloudflare",
+            "Pinterest": "pinterest",
+            "YouTube Shorts": "youtube_shorts"
+        }
+        
         # Create handler
-        self.handler = VideoFileHandler(self.on_file_detected)
+        self.handler = VideoFileHandler(
+            self.on_file_detected,
+            sidecar_callback=self.sidecar_callback and self.on_sidecar_detected
+        )
     
     def start_watching(self):
         """Start monitoring all folders"""
@@ -108,20 +300,21 @@ class FolderWatcher:
             for watch_path in self.watch_paths:
                 if os.path.exists(watch_path):
                     self.observer.schedule(self.handler, watch_path, recursive=False)
-                    print(f"Started watching: {watch_path}")
+                    log.info("Started watching: %s", watch_path)
                     watched_count += 1
                 else:
-                    print(f"Warning: Folder doesn't exist: {watch_path}")
+                    log.warning("Folder doesn't exist: %s", watch_path)
             
             if watched_count == 0:
                 raise Exception("No valid folders found to watch")
             
+            self.handler.start_scheduler()
             self.observer.start()
             self.is_watching = True
-            print(f"Folder watching started successfully - monitoring {watched_count} folders")
+            log.info("Folder watching started successfully - monitoring %s folders", watched_count)
             
         except Exception as e:
-            print(f"Error starting folder watcher: {e}")
+            log.error("Error starting folder watcher: %s", e)
             raise
     
     def stop_watching(self):
@@ -129,12 +322,13 @@ class FolderWatcher:
         if self.is_watching:
             self.observer.stop()
             self.observer.join()
+            self.handler.stop_scheduler()
             self.is_watching = False
-            print("Folder watching stopped")
+            log.info("Folder watching stopped")
     
     def on_file_detected(self, file_path):
         """Called when a new video file is detected"""
-        print(f"New file detected: {file_path}")
+        log.info("New file detected: %s", file_path)
         
         # Determine which folder the file is in
         folder_type = self.get_folder_type(file_path)
@@ -142,17 +336,17 @@ class FolderWatcher:
         # Call the main callback with file info
         self.file_callback(file_path, folder_type)
     
+    def on_sidecar_detected(self, file_path):
+        """Called when a video's text file appears or changes"""
+        log.debug("Text file changed: %s", file_path)
+        self.sidecar_callback(file_path)
+    
     def get_folder_type(self, file_path):
         """Determine which type of folder contains the file"""
-        normalized_path = file_path.replace('\\', '/')
-        
-        if "CloudFlare" in normalized_path:
-            return "cloudflare"
-        elif "Pinterest" in normalized_path:
-            return "pinterest"
-        elif "YouTube Shorts" in normalized_path:
-            return "youtube_shorts"
-        else:
+        try:
+            first = Path(file_path).relative_to(self._base).parts[0]
+            return self._folder_map.get(first, "unknown")
+        except (ValueError, IndexError):
             return "unknown"
     
     def create_missing_folders(self):
@@ -163,9 +357,9 @@ class FolderWatcher:
                 try:
                     os.makedirs(watch_path, exist_ok=True)
                     created_folders.append(watch_path)
-                    print(f"Created missing folder: {watch_path}")
+                    log.info("Created missing folder: %s", watch_path)
                 except Exception as e:
-                    print(f"Failed to create folder {watch_path}: {e}")
+                    log.error("Failed to create folder %s: %s", watch_path, e)
         return created_folders
     
     def get_watch_status(self):
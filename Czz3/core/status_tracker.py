@@ -3,14 +3,37 @@ Status Tracker - Manages upload status files and progress tracking
 """
 
 import os
-import json
+import re
+import time
+import queue
+import logging
+import threading
+from collections import Counter
+from collections import Counter
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+_STOP_WRITER = object()  # Queued by close() after the last write
+
+@lru_cache(maxsize=1024)
+def _split_video_path(file_path: str) -> Tuple[str, str]:
+    """Return (parent directory, status file prefix) for a video path"""
+    video_file = Path(file_path)
+    parent_str = str(video_file.parent)
+    return parent_str, parent_str + os.sep + video_file.stem
 
 class StatusTracker:
     """Tracks upload status for video files using status files"""
     
+    # Statuses that mean a file is done / should show up as a recent upload
+    PROCESSED_STATUSES = frozenset({'COMPLETED', 'ERROR'})
+    RECENT_STATUSES = frozenset({'COMPLETED', 'PARTIAL'})
+    
     def __init__(self):
         self.status_types = {
             'UPLOADING': 'Upload in progress',
@@ -20,107 +43,209 @@ class StatusTracker:
             'CANCELLED': 'Upload cancelled by user'
         }
         
-    def create_status_file(self, file_path: str, status: str, content: str = ""):
+        # Status names paired with their status file suffixes, built once
+        self._status_list = tuple(self.status_types)
+        self._status_set = frozenset(self._status_list)
+        self._status_suffixes = tuple(f"_{status}.txt" for status in self._status_list)
+        self._status_pairs = tuple(zip(self._status_list, self._status_suffixes))
+        
+        # Matches "<video base name>_<STATUS>.txt" in a single pass
+        self._status_re = re.compile(
+            r'^(.+)_(' + '|'.join(map(re.escape, self._status_list)) + r')\.txt$'
+        )
+        
+        # Status file writes go to a single background writer, so upload threads
+        # don't block on disk I/O; close() stops it once the queue is drained
+        self._write_queue = queue.SimpleQueue()
+        self._pending_writes = Counter()  # absolute video path -> queued writes for it
+        self._writes_done = threading.Condition()
+        self._read_flush_timeout = 5.0  # Reads wait this long for their queued writes, then go ahead
+        self._writer_thread = threading.Thread(target=self._run_writer, daemon=True)
+        self._writer_thread.start()
+        
+    def _paths(self, file_path: str) -> Tuple[str, str]:
+        """Get the (parent directory, path prefix) used to build status file names"""
+        return _split_video_path(str(file_path))
+        
+    def _submit_write(self, operation, *args) -> Future:
+        """Queue a status file operation for the writer thread"""
+        future = Future()
+        key = os.path.abspath(str(args[0]))
+        with self._writes_done:
+            closed = self._writer_thread is None
+            if not closed:
+                self._pending_writes[key] += 1
+                self._write_queue.put((key, operation, args, future))
+        if closed:
+            # Nothing drains the queue after close(), so write on the caller's thread
+            self._run_write(operation, args, future)
+        return future
+        
+    def _run_write(self, operation, args, future):
+        """Run one status file operation and hand its result to the future"""
+        try:
+            future.set_result(operation(*args))
+        except Exception as e:
+            future.set_exception(e)
+        
+    def _run_writer(self):
+        """Run queued writes in order until close() queues the stop marker"""
+        while True:
+            item = self._write_queue.get()
+            if item is _STOP_WRITER:
+                return
+            key, operation, args, future = item
+            self._run_write(operation, args, future)
+            
+            with self._writes_done:
+                self._pending_writes[key] -= 1
+                if not self._pending_writes[key]:
+                    del self._pending_writes[key]
+                self._writes_done.notify_all()
+                
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued status writes are on disk"""
+        with self._writes_done:
+            return self._writes_done.wait_for(lambda: not self._pending_writes, timeout)
+            
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Write out everything queued, then stop the writer thread; False if it didn't finish in time"""
+        with self._writes_done:
+            thread, self._writer_thread = self._writer_thread, None
+            if thread is None:
+                return True
+            self._write_queue.put(_STOP_WRITER)
+        thread.join(timeout)
+        return not thread.is_alive()
+        
+    def _wait_for_writes(self, path: str, folder: bool = False):
+        """Let queued writes for one video (or every video under a folder) land before reading it"""
+        path = os.path.abspath(str(path))
+        if folder:
+            root = os.path.join(path, '')
+            is_target = lambda key: key.startswith(root)
+        else:
+            is_target = lambda key: key == path
+            
+        # Writes to other files don't hold the read up, and a stuck disk only delays it so long
+        with self._writes_done:
+            done = self._writes_done.wait_for(
+                lambda: not any(map(is_target, self._pending_writes)), self._read_flush_timeout
+            )
+        if not done:
+            log.warning("Status writes for %s still pending after %.0fs, reading anyway", path, self._read_flush_timeout)
+        
+    def create_status_file(self, file_path: str, status: str, content: str = "") -> bool:
+        """Create a status file for a video file"""
+        return self.submit_status_file(file_path, status, content).result()
+        
+    def submit_status_file(self, file_path: str, status: str, content: str = "") -> Future:
+        """Queue a status file for the writer without waiting; the Future holds create_status_file's result"""
+        return self._submit_write(self._write_status_file, file_path, status, content)
+        
+    def update_status(self, file_path: str, status: str, platform: str, message: str) -> bool:
+        """Update status file with platform-specific progress"""
+        return self._submit_write(self._append_status_update, file_path, status, platform, message).result()
+        
+    def cleanup_status_files(self, file_path: str, keep: Optional[str] = None) -> bool:
+        """Remove all status files for a video file"""
+        return self._submit_write(self._remove_status_files, file_path, keep).result()
+        
+    def _write_status_file(self, file_path: str, status: str, content: str = ""):
         """Create a status file for a video file"""
         try:
-            video_file = Path(file_path)
-            base_name = video_file.stem
-            parent_dir = video_file.parent
-            
-            # Clean up any existing status files first
-            self.cleanup_status_files(file_path)
+            _, prefix = self._paths(file_path)
+            video_name = os.path.basename(file_path)
             
             # Create new status file
-            status_file = parent_dir / f"{base_name}_{status}.txt"
-            
-            # Create status content
-            status_content = {
-                'status': status,
-                'timestamp': datetime.now().isoformat(),
-                'file': video_file.name,
-                'message': content,
-                'details': self.status_types.get(status, 'Unknown status')
-            }
-            
-            # Write status file
-            with open(status_file, 'w', encoding='utf-8') as f:
-                if content:
-                    f.write(f"{status} - {content}\n")
-                else:
-                    f.write(f"{status}\n")
-                f.write(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"File: {video_file.name}\n")
+            status_file = prefix + f"_{status}.txt"
+            temp_file = status_file + ".tmp"
+            
+            now = time.localtime()
+            
+            # Write to a temp file and rename it into place so readers never
+            # see a half-written status file
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    if content:
+                        f.write(f"{status} - {content}\n")
+                    else:
+                        f.write(f"{status}\n")
+                    f.write(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S', now)}\n")
+                    f.write(f"File: {video_name}\n")
+                os.replace(temp_file, status_file)
+            except BaseException:
+                # Don't leave a stray .tmp next to the video when the write or rename fails
+                try:
+                    os.unlink(temp_file)
+                except OSError:
+                    pass
+                raise
+            
+            # Remove the previous status file(s) now that the new one exists
+            self._remove_status_files(file_path, keep=status)
                 
             return True
             
         except Exception as e:
-            print(f"Error creating status file: {e}")
+            log.error("Error creating status file: %s", e)
             return False
             
-    def update_status(self, file_path: str, status: str, platform: str, message: str):
+    def _append_status_update(self, file_path: str, status: str, platform: str, message: str):
         """Update status file with platform-specific progress"""
         try:
-            video_file = Path(file_path)
-            base_name = video_file.stem
-            parent_dir = video_file.parent
+            _, prefix = self._paths(file_path)
             
-            # Find existing status file
+            # Find existing status file, probing the caller's status first
+            # since it is usually the current one
             status_file = None
-            for status_type in self.status_types.keys():
-                potential_file = parent_dir / f"{base_name}_{status_type}.txt"
-                if potential_file.exists():
+            suffixes = self._status_suffixes
+            if status in self._status_set:
+                suffixes = (f"_{status}.txt",) + suffixes
+            for suffix in suffixes:
+                potential_file = prefix + suffix
+                if os.path.exists(potential_file):
                     status_file = potential_file
                     break
                     
             if not status_file:
                 # Create new status file if none exists
-                status_file = parent_dir / f"{base_name}_{status}.txt"
+                status_file = prefix + f"_{status}.txt"
                 
-            # Read existing content
-            existing_content = ""
-            if status_file.exists():
-                with open(status_file, 'r', encoding='utf-8') as f:
-                    existing_content = f.read()
-                    
-            # Append new status update
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            new_line = f"{timestamp} - {platform}: {message}\n"
-            
-            # Write updated content
-            with open(status_file, 'w', encoding='utf-8') as f:
-                f.write(existing_content)
-                f.write(new_line)
+            # Append new status update (creates the file if needed)
+            timestamp = time.strftime('%H:%M:%S')
+            with open(status_file, 'a', encoding='utf-8') as f:
+                f.write(f"{timestamp} - {platform}: {message}\n")
                 
             return True
             
         except Exception as e:
-            print(f"Error updating status file: {e}")
+            log.error("Error updating status file: %s", e)
             return False
             
     def get_file_status(self, file_path: str) -> Optional[Dict]:
         """Get current status of a file"""
         try:
-            video_file = Path(file_path)
-            base_name = video_file.stem
-            parent_dir = video_file.parent
+            self._wait_for_writes(file_path)
+            _, prefix = self._paths(file_path)
             
             # Check for status files
-            for status_type in self.status_types.keys():
-                status_file = parent_dir / f"{base_name}_{status_type}.txt"
-                if status_file.exists():
+            for status_type, suffix in self._status_pairs:
+                status_file = prefix + suffix
+                if os.path.exists(status_file):
                     # Read status file content
                     with open(status_file, 'r', encoding='utf-8') as f:
                         content = f.read().strip()
                         
                     # Get file modification time
-                    mod_time = datetime.fromtimestamp(status_file.stat().st_mtime)
+                    mod_time = datetime.fromtimestamp(os.stat(status_file).st_mtime)
                     
                     return {
                         'status': status_type,
                         'description': self.status_types[status_type],
                         'content': content,
                         'timestamp': mod_time.isoformat(),
-                        'file_path': str(status_file)
+                        'file_path': status_file
                     }
                     
             # No status file found
@@ -128,68 +253,80 @@ class StatusTracker:
                 'status': 'PENDING',
                 'description': 'Ready for upload',
                 'content': '',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
                 'file_path': None
             }
             
         except Exception as e:
-            print(f"Error getting file status: {e}")
+            log.error("Error getting file status: %s", e)
             return None
             
-    def cleanup_status_files(self, file_path: str):
-        """Remove all status files for a video file"""
+    def _remove_status_files(self, file_path: str, keep: Optional[str] = None):
+        """Remove all status files for a video file, optionally keeping one status"""
         try:
-            video_file = Path(file_path)
-            base_name = video_file.stem
-            parent_dir = video_file.parent
-            
-            for status_type in self.status_types.keys():
-                status_file = parent_dir / f"{base_name}_{status_type}.txt"
-                if status_file.exists():
-                    status_file.unlink()
+            _, prefix = self._paths(file_path)
+            removed_all = True
+            
+            for status_type, suffix in self._status_pairs:
+                if status_type == keep:
+                    continue
+                try:
+                    os.unlink(prefix + suffix)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    # A locked or read-only file shouldn't stop the others being removed
+                    log.error("Error removing status file %s: %s", prefix + suffix, e)
+                    removed_all = False
                     
-            return True
+            return removed_all
             
         except Exception as e:
-            print(f"Error cleaning up status files: {e}")
+            log.error("Error cleaning up status files: %s", e)
             return False
             
+    def _scan_status_entries(self, folder_path: str):
+        """Yield (DirEntry, base_name, status_type) for every status file under a folder"""
+        pending = [folder_path]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not entry.name.endswith('.txt'):
+                        continue
+                    match = self._status_re.match(entry.name)
+                    if match and entry.is_file():
+                        yield entry, match.group(1), match.group(2)
+        
     def get_all_status_files(self, folder_path: str) -> Dict[str, Dict]:
         """Get status information for all files in a folder"""
         status_info = {}
         
         try:
-            folder = Path(folder_path)
-            if not folder.exists():
+            self._wait_for_writes(folder_path, folder=True)
+            if not os.path.isdir(folder_path):
                 return status_info
                 
             # Find all status files
-            for status_file in folder.rglob('*_*.txt'):
-                filename = status_file.name
+            for entry, base_name, status_type in self._scan_status_entries(folder_path):
+                # Read status content
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    content = f.read().strip()
+                    
+                mod_time = datetime.fromtimestamp(entry.stat().st_mtime)
                 
-                # Check if it's a status file
-                for status_type in self.status_types.keys():
-                    if filename.endswith(f'_{status_type}.txt'):
-                        # Extract original video filename
-                        base_name = filename.replace(f'_{status_type}.txt', '')
-                        
-                        # Read status content
-                        with open(status_file, 'r', encoding='utf-8') as f:
-                            content = f.read().strip()
-                            
-                        mod_time = datetime.fromtimestamp(status_file.stat().st_mtime)
-                        
-                        status_info[base_name] = {
-                            'status': status_type,
-                            'description': self.status_types[status_type],
-                            'content': content,
-                            'timestamp': mod_time.isoformat(),
-                            'file_path': str(status_file)
-                        }
-                        break
+                status_info[base_name] = {
+                    'status': status_type,
+                    'description': self.status_types[status_type],
+                    'content': content,
+                    'timestamp': mod_time.isoformat(),
+                    'file_path': entry.path
+                }
                         
         except Exception as e:
-            print(f"Error getting status files: {e}")
+            log.error("Error getting status files: %s", e)
             
         return status_info
         
@@ -223,7 +360,7 @@ class StatusTracker:
                     stats['pending'] += 1
                     
         except Exception as e:
-            print(f"Error getting upload statistics: {e}")
+            log.error("Error getting upload statistics: %s", e)
             
         return stats
         
@@ -238,7 +375,7 @@ class StatusTracker:
             return self.create_status_file(file_path, "COMPLETED", message)
             
         except Exception as e:
-            print(f"Error marking file completed: {e}")
+            log.error("Error marking file completed: %s", e)
             return False
             
     def mark_file_failed(self, file_path: str, error_message: str):
@@ -247,7 +384,7 @@ class StatusTracker:
             return self.create_status_file(file_path, "ERROR", error_message)
             
         except Exception as e:
-            print(f"Error marking file failed: {e}")
+            log.error("Error marking file failed: %s", e)
             return False
             
     def mark_file_partial(self, file_path: str, successful_platforms: list, failed_platforms: list):
@@ -260,19 +397,19 @@ class StatusTracker:
             return self.create_status_file(file_path, "PARTIAL", message)
             
         except Exception as e:
-            print(f"Error marking file partial: {e}")
+            log.error("Error marking file partial: %s", e)
             return False
             
     def is_file_processed(self, file_path: str) -> bool:
         """Check if a file has already been processed (completed or failed)"""
         try:
             status = self.get_file_status(file_path)
-            if status and status['status'] in ['COMPLETED', 'ERROR']:
+            if status and status['status'] in self.PROCESSED_STATUSES:
                 return True
             return False
             
         except Exception as e:
-            print(f"Error checking if file is processed: {e}")
+            log.error("Error checking if file is processed: %s", e)
             return False
             
     def get_recent_uploads(self, folder_path: str, limit: int = 10) -> list:
@@ -285,7 +422,7 @@ class StatusTracker:
             # Convert to list and sort by timestamp
             uploads = []
             for filename, info in status_info.items():
-                if info['status'] in ['COMPLETED', 'PARTIAL']:
+                if info['status'] in self.RECENT_STATUSES:
                     uploads.append({
                         'filename': filename,
                         'status': info['status'],
@@ -300,29 +437,29 @@ class StatusTracker:
             recent_uploads = uploads[:limit]
             
         except Exception as e:
-            print(f"Error getting recent uploads: {e}")
+            log.error("Error getting recent uploads: %s", e)
             
         return recent_uploads
         
     def cleanup_old_status_files(self, folder_path: str, days_old: int = 30):
         """Clean up status files older than specified days"""
         try:
-            folder = Path(folder_path)
-            if not folder.exists():
+            self._wait_for_writes(folder_path, folder=True)
+            if not os.path.isdir(folder_path):
                 return 0
                 
-            cutoff_time = datetime.now().timestamp() - (days_old * 24 * 3600)
+            cutoff_time = time.time() - (days_old * 24 * 3600)
             cleaned_count = 0
             
-            for status_file in folder.rglob('*_*.txt'):
-                # Check if it's a status file
-                if any(status_file.name.endswith(f'_{status}.txt') for status in self.status_types.keys()):
-                    if status_file.stat().st_mtime < cutoff_time:
-                        status_file.unlink()
-                        cleaned_count += 1
+            # DirEntry.stat() is cached by scandir (free on Windows), so each
+            # status file costs at most one stat call
+            for entry, _, _ in self._scan_status_entries(folder_path):
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                    os.unlink(entry.path)
+                    cleaned_count += 1
                         
             return cleaned_count
             
         except Exception as e:
-            print(f"Error cleaning up old status files: {e}")
+            log.error("Error cleaning up old status files: %s", e)
             return 0 
\ No newline at end of file
@@ -2,54 +2,209 @@
 Upload Manager - Handles concurrent uploads and queue management
 """
 
+import asyncio
 import threading
 import queue
 import time
 import os
+import logging
+from collections import deque
 from typing import Dict, List, Callable, Optional
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from core.file_manager import FileInfo
 from core.status_tracker import StatusTracker
 
+log = logging.getLogger(__name__)
+
+# Platforms every file in a watched folder is uploaded to
+_FOLDER_PLATFORMS = {
+    'cloudflare': ('cloudflare', 'facebook'),
+    'pinterest': ('pinterest',),
+    'youtube_shorts': ('youtube_shorts',),
+}
+
+# Progress types where only the latest value matters, older ones are dropped when batching
+_COALESCED_PROGRESS = frozenset(('queue', 'progress', 'current'))
+
+# Fitness hashtags appended to every Pinterest title (first 5 of the set)
+_PINTEREST_SUFFIX = " " + " ".join([
+    "#fitness", "#workout", "#training", "#exercise", "#health"
+])
+
 class UploadManager:
     """Manages concurrent file uploads to multiple platforms"""
     
+    # Internal platform names that share another platform's credentials
+    _PLATFORM_KEY = {'youtube_shorts': 'youtube'}  # YouTube Shorts uses same API as regular YouTube
+    
     def __init__(self, max_concurrent: int = 3):
         self.max_concurrent = max_concurrent
         self.upload_queue = queue.Queue()
+        self._queued = 0  # Mirrors upload_queue's size so readers don't take its mutex; written under it
         self.active_uploads = {}
         self.enabled_platforms = {}
         self.progress_callback = None
         self.status_tracker = StatusTracker()
+        
+        # Blocking platform API calls run on this pool; the event loop only coordinates them
         self.executor = None
+        self._executor_lock = threading.Lock()
+        self._upload_run = None
+        self._upload_task = None  # Task of the current run, set on the event loop thread
+        self._run_lock = threading.Lock()  # One upload run at a time
+        self._restart_after_abort = False
+        
+        # Progress events are buffered and delivered in batches by one drain thread
+        self._progress_buf = deque()  # Unbounded: log/complete/error events must never be dropped
+        self._progress_ready = threading.Event()
+        self._progress_thread = None
+        self._progress_lock = threading.Lock()
+        
+        # API clients cached per worker thread, dropped when credentials change
+        self._clients = threading.local()
+        self._clients_generation = 0
+        
         self.is_running = False
         self.abort_requested = False
         
+        # Event loop thread that reads metadata sidecars and drives the uploads
+        self._io_loop = None
+        self._io_loop_lock = threading.Lock()
+        
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared platform upload pool, recreating it if an abort shut it down"""
+        with self._executor_lock:
+            if self.executor is None:
+                # Up to four platforms per file (CloudFlare, Facebook, YouTube, Pinterest)
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent * 4, thread_name_prefix='upload'
+                )
+            return self.executor
+            
+    def _shutdown_executor(self, wait: bool):
+        """Shut down the upload pool, it is recreated on next use"""
+        with self._executor_lock:
+            executor, self.executor = self.executor, None
+        if executor:
+            executor.shutdown(wait=wait)
+            
+    def close(self):
+        """Wait for running uploads and release the worker threads"""
+        self._shutdown_executor(wait=True)
+            
     def set_enabled_platforms(self, platforms: Dict):
         """Set which platforms are enabled with their credentials"""
+        if platforms != self.enabled_platforms:
+            self._clients_generation += 1  # Rebuild clients with the new credentials
         self.enabled_platforms = platforms
         
+    def _get_client(self, platform: str):
+        """Get this thread's API client for a platform, creating it on first use"""
+        clients = self._clients
+        if getattr(clients, 'generation', None) != self._clients_generation:
+            clients.generation = self._clients_generation
+            clients.by_platform = {}
+            
+        client = clients.by_platform.get(platform)
+        if client is None:
+            client = clients.by_platform[platform] = self._create_client(platform)
+        return client
+        
+    def _create_client(self, platform: str):
+        """Construct an API client from the enabled platform credentials"""
+        creds = self.enabled_platforms[platform]
+        
+        if platform == 'cloudflare':
+            from api.cloudflare import CloudFlareAPI
+            return CloudFlareAPI(creds['api_token'], creds['account_id'])
+            
+        elif platform == 'youtube':
+            from api.youtube import YouTubeAPI
+            api = YouTubeAPI(creds['client_id'], creds['client_secret'])
+            
+            # Set refresh token if available
+            if creds.get('refresh_token'):
+                api.set_refresh_token(creds['refresh_token'])
+            return api
+            
+        elif platform == 'pinterest':
+            from api.pinterest import PinterestAPI
+            return PinterestAPI(creds['access_token'])
+            
+        elif platform == 'facebook':
+            from api.facebook import FacebookAPI
+            return FacebookAPI(creds['page_token'], creds['group_id'])
+            
+        raise ValueError(f"Unknown platform: {platform}")
+        
     def set_progress_callback(self, callback: Callable):
         """Set callback function for progress updates"""
         self.progress_callback = callback
         
     def add_to_queue(self, file_info: FileInfo):
         """Add a file to the upload queue"""
-        self.upload_queue.put(file_info)
-        
+        # Put and count under the queue's own lock, the one abort_all clears it under
+        q = self.upload_queue
+        with q.mutex:
+            q._put(file_info)
+            q.unfinished_tasks += 1
+            self._queued += 1
+            q.not_empty.notify()
+            
+    def _take_from_queue(self) -> Optional[FileInfo]:
+        """Take the next queued file, or None if the queue is empty"""
+        q = self.upload_queue
+        with q.mutex:
+            if not q._qsize():
+                return None
+            self._queued -= 1
+            file_info = q._get()
+            q.not_full.notify()
+            return file_info
+            
     def add_single_file(self, file_path: str, folder_type: str):
         """Add a single file to the upload queue with minimal processing"""
+        self.add_files_batch([file_path], folder_type)
+        
+    def add_files_batch(self, file_paths: List[str], folder_type: str) -> int:
+        """Add several files to the upload queue, reading all their metadata concurrently"""
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                self._ingest_batch(file_paths, folder_type), self._get_io_loop()
+            )
+            return future.result()
+        except Exception as e:
+            self._send_progress("log", f"Error adding files to queue: {str(e)}")
+            return 0
+            
+    def _get_io_loop(self) -> asyncio.AbstractEventLoop:
+        """Get or start the background event loop for metadata reads and uploads"""
+        with self._io_loop_lock:
+            if self._io_loop is None:
+                self._io_loop = asyncio.new_event_loop()
+                threading.Thread(target=self._io_loop.run_forever, daemon=True).start()
+            return self._io_loop
+            
+    async def _ingest_batch(self, file_paths: List[str], folder_type: str) -> int:
+        """Ingest a batch of files concurrently, returns how many were queued"""
+        results = await asyncio.gather(*[self._ingest(path, folder_type) for path in file_paths])
+        return sum(1 for added in results if added)
+        
+    async def _ingest(self, file_path: str, folder_type: str) -> bool:
+        """Read a file's metadata sidecars and add it to the upload queue"""
         try:
             # Create basic file info
             filename = os.path.basename(file_path)
             base_name = os.path.splitext(file_path)[0]
             
-            # Read metadata files
-            title = self._read_text_file(base_name + "_TITLE.txt")
-            description = self._read_text_file(base_name + "_DESCRIPTION.txt")
-            short_desc = self._read_text_file(base_name + "_SHORT_DESC.txt")
+            # Read metadata files concurrently
+            title, description, short_desc = await asyncio.gather(
+                self._read_text_file_async(base_name + "_TITLE.txt"),
+                self._read_text_file_async(base_name + "_DESCRIPTION.txt"),
+                self._read_text_file_async(base_name + "_SHORT_DESC.txt")
+            )
             
             # Determine target platforms
             platforms = self._get_target_platforms_for_folder(folder_type, filename)
@@ -58,6 +213,7 @@ class UploadManager:
             file_info = FileInfo(
                 path=file_path,
                 filename=filename,
+                folder_type=folder_type,
                 title=title or os.path.splitext(filename)[0],
                 description=description,
                 short_description=short_desc,
@@ -65,104 +221,98 @@ class UploadManager:
             )
             
             # Add to queue
-            self.upload_queue.put(file_info)
+            self.add_to_queue(file_info)
             
             self._send_progress("log", f"Added to queue: {filename}")
-            self._send_progress("queue", self.upload_queue.qsize())
+            self._send_progress("queue", self._queued)
+            return True
             
         except Exception as e:
             self._send_progress("log", f"Error adding file to queue: {str(e)}")
+            return False
+            
+    async def _read_text_file_async(self, file_path: str) -> str:
+        """Read a text file without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_text_file, file_path)
             
     def _read_text_file(self, file_path: str) -> str:
         """Read text file content, return empty string if file doesn't exist"""
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read().strip()
+        except (FileNotFoundError, IsADirectoryError):
+            pass
         except Exception as e:
             print(f"Error reading text file {file_path}: {e}")
         return ""
         
     def _get_target_platforms_for_folder(self, folder_type: str, filename: str) -> List[str]:
         """Determine target platforms based on folder type and filename"""
-        platforms = []
+        platforms = list(_FOLDER_PLATFORMS.get(folder_type, ()))
         
-        if folder_type == 'cloudflare':
-            # Always upload to CloudFlare and Facebook
-            platforms.extend(['cloudflare', 'facebook'])
-            
-            # Upload "001" files to YouTube as well
-            if "001" in filename:
-                platforms.append('youtube')
-                
-        elif folder_type == 'pinterest':
-            platforms.append('pinterest')
+        # Upload "001" files to YouTube as well
+        if folder_type == 'cloudflare' and "001" in filename:
+            platforms.append('youtube')
             
-        elif folder_type == 'youtube_shorts':
-            platforms.append('youtube_shorts')
-        
         return platforms
         
     def start_uploads(self):
         """Start processing the upload queue"""
-        if self.is_running:
-            return
+        # is_running is only cleared by the run itself, so this can't start a second one
+        with self._run_lock:
+            if self.is_running:
+                # An aborted run is still winding down, start again once it has
+                if self.abort_requested:
+                    self._restart_after_abort = True
+                return
+                
+            self.is_running = True
+            self.abort_requested = False
             
-        self.is_running = True
-        self.abort_requested = False
-        
-        # Start upload processor in background thread
-        upload_thread = threading.Thread(target=self._process_upload_queue, daemon=True)
-        upload_thread.start()
+            # Run the upload processor on the background event loop
+            self._upload_run = asyncio.run_coroutine_threadsafe(
+                self._process_upload_queue(), self._get_io_loop()
+            )
         
-    def _process_upload_queue(self):
-        """Process files in the upload queue with concurrent uploads"""
+    async def _process_upload_queue(self):
+        """Stream files from the upload queue, keeping max_concurrent uploads in flight"""
+        in_flight = {}  # task -> FileInfo
+        self._upload_task = asyncio.current_task()
         try:
-            # Get all files from queue
-            files_to_upload = []
-            while not self.upload_queue.empty():
-                try:
-                    file_info = self.upload_queue.get_nowait()
-                    files_to_upload.append(file_info)
-                except queue.Empty:
-                    break
-                    
-            if not files_to_upload:
-                self._send_progress("log", "No files to upload")
-                self._send_progress("complete", None)
-                return
-                
-            self._send_progress("log", f"Starting upload of {len(files_to_upload)} files")
-            self._send_progress("queue", len(files_to_upload))
+            submitted = 0
+            completed = 0
             
-            # Process uploads with thread pool
-            with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-                self.executor = executor
-                
-                # Submit all upload tasks
-                future_to_file = {}
-                for file_info in files_to_upload:
-                    if self.abort_requested:
+            self._send_progress("log", f"Starting uploads ({self._queued} files queued)")
+            self._send_progress("queue", self._queued)
+            
+            while not self.abort_requested:
+                # Top up from the queue; files added mid-run are picked up too
+                while len(in_flight) < self.max_concurrent and not self.abort_requested:
+                    file_info = self._take_from_queue()
+                    if file_info is None:
                         break
-                        
-                    future = executor.submit(self._upload_file, file_info)
-                    future_to_file[future] = file_info
+                    in_flight[asyncio.ensure_future(self._upload_file(file_info))] = file_info
+                    submitted += 1
                     
-                # Process completed uploads
-                completed = 0
-                for future in as_completed(future_to_file):
-                    if self.abort_requested:
+                if not in_flight:
+                    # Give files arriving just as the run ends a moment to show up
+                    await asyncio.sleep(0.5)
+                    if self.upload_queue.empty():
                         break
-                        
-                    file_info = future_to_file[future]
+                    continue
+                    
+                done, _ = await asyncio.wait(in_flight, timeout=0.5, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    file_info = in_flight.pop(task)
+                    completed += 1
                     try:
-                        result = future.result()
-                        completed += 1
+                        result = task.result()
                         
-                        remaining = len(files_to_upload) - completed
-                        self._send_progress("queue", remaining)
+                        queued = self._queued
+                        self._send_progress("queue", submitted - completed + queued)
                         
-                        progress_percent = (completed / len(files_to_upload)) * 100
+                        progress_percent = (completed / (submitted + queued)) * 100
                         self._send_progress("progress", progress_percent)
                         
                         if result:
@@ -173,23 +323,44 @@ class UploadManager:
                     except Exception as e:
                         self._send_progress("log", f"Upload error for {file_info.filename}: {str(e)}")
                         
-            self._send_progress("log", "All uploads completed")
+            if submitted == 0:
+                self._send_progress("log", "No files to upload")
+            else:
+                self._send_progress("log", "All uploads completed")
+            self._send_progress("complete", None)
+            
+        except asyncio.CancelledError:
+            # abort_all cancelled the run, stop the files still uploading
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
             self._send_progress("complete", None)
             
         except Exception as e:
             self._send_progress("error", f"Upload manager error: {str(e)}")
             
         finally:
-            self.is_running = False
-            self.executor = None
+            with self._run_lock:
+                self._upload_task = None
+                self.is_running = False
+                restart = self._restart_after_abort
+                self._restart_after_abort = False
+                
+        # A file queued just as the loop went idle would otherwise wait for the next run
+        if restart or (not self.abort_requested and not self.upload_queue.empty()):
+            self.start_uploads()
             
-    def _upload_file(self, file_info: FileInfo) -> bool:
+    async def _upload_file(self, file_info: FileInfo) -> bool:
         """Upload a single file to all its target platforms"""
+        if self.abort_requested:
+            return False
+            
+        platform_tasks = {}
         try:
             self._send_progress("current", f"{file_info.filename}")
             
             # Create status file to indicate upload in progress
-            self.status_tracker.create_status_file(file_info.path, "UPLOADING")
+            self.status_tracker.submit_status_file(file_info.path, "UPLOADING")
             
             success_count = 0
             total_platforms = 0
@@ -203,59 +374,69 @@ class UploadManager:
                 
             self._send_progress("log", f"Uploading {file_info.filename} to: {', '.join(target_platforms)}")
             
-            # Upload to each target platform
+            # Upload to all target platforms at once - they are independent endpoints
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
             for platform in target_platforms:
-                if self.abort_requested:
-                    break
-                    
-                total_platforms += 1
+                task = loop.run_in_executor(executor, self._upload_to_platform, file_info, platform)
+                platform_tasks[task] = platform
                 
-                try:
-                    success = self._upload_to_platform(file_info, platform)
-                    if success:
-                        success_count += 1
-                        self._send_progress("log", f"✓ {platform}: {file_info.filename}")
-                    else:
-                        self._send_progress("log", f"✗ {platform}: {file_info.filename}")
-                        
-                except Exception as e:
-                    self._send_progress("log", f"✗ {platform}: {file_info.filename} - {str(e)}")
+            pending = set(platform_tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    platform = platform_tasks[task]
+                    total_platforms += 1
                     
+                    try:
+                        success = task.result()
+                        if success:
+                            success_count += 1
+                            self._send_progress("log", f"✓ {platform}: {file_info.filename}")
+                        else:
+                            self._send_progress("log", f"✗ {platform}: {file_info.filename}")
+                            
+                    except Exception as e:
+                        self._send_progress("log", f"✗ {platform}: {file_info.filename} - {str(e)}")
+                        
             # Update status based on results
             if success_count == total_platforms:
-                self.status_tracker.create_status_file(file_info.path, "COMPLETED", 
+                self.status_tracker.submit_status_file(file_info.path, "COMPLETED", 
                     f"Successfully uploaded to {success_count} platforms")
                 return True
             elif success_count > 0:
-                self.status_tracker.create_status_file(file_info.path, "PARTIAL", 
+                self.status_tracker.submit_status_file(file_info.path, "PARTIAL", 
                     f"Uploaded to {success_count}/{total_platforms} platforms")
                 return False
             else:
-                self.status_tracker.create_status_file(file_info.path, "ERROR", 
+                self.status_tracker.submit_status_file(file_info.path, "ERROR", 
                     "Failed to upload to any platform")
                 return False
                 
+        except asyncio.CancelledError:
+            # Drop platform uploads that haven't started yet; the file stays UPLOADING for a retry
+            for task in platform_tasks:
+                task.cancel()
+            raise
+            
         except Exception as e:
-            self.status_tracker.create_status_file(file_info.path, "ERROR", str(e))
+            self.status_tracker.submit_status_file(file_info.path, "ERROR", str(e))
             return False
             
     def _get_target_platforms(self, file_info: FileInfo) -> List[str]:
         """Get list of platforms this file should be uploaded to"""
-        target_platforms = []
-        
-        for platform in file_info.platforms:
-            # Map internal platform names to enabled platform names
-            platform_key = platform
-            if platform == 'youtube_shorts':
-                platform_key = 'youtube'  # YouTube Shorts uses same API as regular YouTube
-                
-            if platform_key in self.enabled_platforms:
-                target_platforms.append(platform)
-                
-        return target_platforms
+        # Map internal platform names to enabled platform names
+        return [
+            platform for platform in file_info.platforms
+            if self._PLATFORM_KEY.get(platform, platform) in self.enabled_platforms
+        ]
         
     def _upload_to_platform(self, file_info: FileInfo, platform: str) -> bool:
         """Upload file to a specific platform"""
+        # Skip client setup for calls that only got a worker after an abort
+        if self.abort_requested:
+            return False
+            
         try:
             if platform == 'cloudflare':
                 return self._upload_to_cloudflare(file_info)
@@ -277,10 +458,7 @@ class UploadManager:
     def _upload_to_cloudflare(self, file_info: FileInfo) -> bool:
         """Upload file to CloudFlare Stream"""
         try:
-            from api.cloudflare import CloudFlareAPI
-            
-            creds = self.enabled_platforms['cloudflare']
-            api = CloudFlareAPI(creds['api_token'], creds['account_id'])
+            api = self._get_client('cloudflare')
             
             result = api.upload_video(file_info.path, file_info.title)
             return result is not None
@@ -295,15 +473,8 @@ class UploadManager:
     def _upload_to_youtube(self, file_info: FileInfo, is_short: bool = False) -> bool:
         """Upload file to YouTube"""
         try:
-            from api.youtube import YouTubeAPI
-            
-            creds = self.enabled_platforms['youtube']
-            api = YouTubeAPI(creds['client_id'], creds['client_secret'])
+            api = self._get_client('youtube')
             
-            # Set refresh token if available
-            if creds.get('refresh_token'):
-                api.set_refresh_token(creds['refresh_token'])
-                
             # Limit title length for YouTube
             title = file_info.title[:100]  # YouTube title limit
             description = file_info.description or file_info.short_description
@@ -321,10 +492,7 @@ class UploadManager:
     def _upload_to_pinterest(self, file_info: FileInfo) -> bool:
         """Upload file to Pinterest"""
         try:
-            from api.pinterest import PinterestAPI
-            
-            creds = self.enabled_platforms['pinterest']
-            api = PinterestAPI(creds['access_token'])
+            api = self._get_client('pinterest')
             
             # Format title for Pinterest
             pinterest_title = self._format_pinterest_title(file_info.title)
@@ -343,11 +511,7 @@ class UploadManager:
     def _upload_to_facebook(self, file_info: FileInfo) -> bool:
         """Upload file to Facebook (scheduled)"""
         try:
-            from api.facebook import FacebookAPI
-            from gui.schedule_tab import ScheduleTab
-            
-            creds = self.enabled_platforms['facebook']
-            api = FacebookAPI(creds['page_token'], creds['group_id'])
+            api = self._get_client('facebook')
             
             # Calculate schedule time (30 days in future by default)
             schedule_time = datetime.now() + timedelta(days=30)
@@ -367,51 +531,77 @@ class UploadManager:
             
     def _format_pinterest_title(self, title: str) -> str:
         """Format title for Pinterest with hashtags and keywords"""
-        # Add fitness-related hashtags
-        hashtags = [
-            "#fitness", "#workout", "#training", "#exercise", 
-            "#health", "#gym", "#strength", "#motivation"
-        ]
-        
-        # Limit title length and add hashtags
-        formatted_title = title[:80]  # Leave room for hashtags
-        formatted_title += " " + " ".join(hashtags[:5])  # Add first 5 hashtags
-        
-        return formatted_title
+        # Limit title length (leaving room for hashtags) and add hashtags
+        return title[:80] + _PINTEREST_SUFFIX
         
     def abort_all(self):
         """Abort all running uploads"""
-        self.abort_requested = True
+        with self._run_lock:
+            self.abort_requested = True
+            self._restart_after_abort = False
         
-        if self.executor:
-            self.executor.shutdown(wait=False)
-            
-        # Clear the queue
-        while not self.upload_queue.empty():
-            try:
-                self.upload_queue.get_nowait()
-            except queue.Empty:
-                break
-                
-        self.is_running = False
+        # Cancel the run on the event loop, then stop the pool without waiting. A run that
+        # hasn't started yet sees abort_requested and exits; either way it clears is_running
+        task = self._upload_task
+        if task is not None:
+            self._get_io_loop().call_soon_threadsafe(task.cancel)
+        self._shutdown_executor(wait=False)
+            
+        # Clear the queue in one step under its lock so concurrent adds can't race the drain
+        with self.upload_queue.mutex:
+            self.upload_queue.queue.clear()
+            self.upload_queue.unfinished_tasks = 0
+            self.upload_queue.all_tasks_done.notify_all()
+            self.upload_queue.not_full.notify_all()
+            self._queued = 0
+            
         self._send_progress("log", "Upload process aborted")
         
     def get_queue_size(self) -> int:
         """Get current queue size"""
-        return self.upload_queue.qsize()
+        return self._queued
         
     def get_active_count(self) -> int:
         """Get number of active uploads"""
         return len(self.active_uploads)
         
     def _send_progress(self, message_type: str, data):
-        """Send progress update via callback"""
-        if self.progress_callback:
-            try:
-                self.progress_callback(message_type, data)
-            except Exception as e:
-                print(f"Progress callback error: {e}")
+        """Buffer a progress update for the callback"""
+        if not self.progress_callback:
+            return
+            
+        self._progress_buf.append((message_type, data))
+        self._progress_ready.set()
+        
+        if self._progress_thread is None:
+            with self._progress_lock:
+                if self._progress_thread is None:
+                    self._progress_thread = threading.Thread(target=self._drain_progress, daemon=True)
+                    self._progress_thread.start()
+                    
+    def _drain_progress(self):
+        """Deliver buffered progress updates every 50ms, keeping only the latest state values"""
+        while True:
+            self._progress_ready.wait()
+            self._progress_ready.clear()
+            
+            events = []
+            while self._progress_buf:
+                events.append(self._progress_buf.popleft())
                 
+            # Drop state updates superseded later in the batch, keep order otherwise
+            last_index = {message_type: i for i, (message_type, _) in enumerate(events)}
+            
+            for i, (message_type, data) in enumerate(events):
+                if message_type in _COALESCED_PROGRESS and last_index[message_type] != i:
+                    continue
+                try:
+                    self.progress_callback(message_type, data)
+                except Exception as e:
+                    log.error("Progress callback error: %s", e)
+                    
+            time.sleep(0.05)
+            
     def get_upload_stats(self) -> Dict:
         """Get upload statistics"""
         return {
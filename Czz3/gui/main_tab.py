@@ -7,10 +7,45 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import queue
 import os
-import datetime
+import time
+import heapq
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
+class DetectedFile:
+    """A watched video with its name parts and sidecar file names worked out once"""
+    __slots__ = ('path', 'folder_type', 'parent', 'filename', 'stem', 'base_name',
+                 'title_file', 'desc_file', 'short_desc_file')
+    
+    def __init__(self, path, folder_type):
+        self.path = path
+        self.folder_type = folder_type
+        self.parent, self.filename = os.path.split(path)
+        
+        # Strip the extension with one scan for the last dot (a leading dot isn't one, as in splitext)
+        dot = self.filename.rfind('.')
+        self.stem = self.filename[:dot] if dot > 0 else self.filename
+        self.base_name = os.path.join(self.parent, self.stem)  # Path without extension
+        
+        # Sidecar names, looked up in the parent folder's listing
+        self.title_file = self.stem + "_TITLE.txt"
+        self.desc_file = self.stem + "_DESCRIPTION.txt"
+        self.short_desc_file = self.stem + "_SHORT_DESC.txt"
+
+@lru_cache(maxsize=64)
+def _dir_entries(dirpath, mtime_ns):
+    """Names in a directory; mtime_ns is part of the key so changes invalidate the entry"""
+    with os.scandir(dirpath) as entries:
+        return frozenset(entry.name for entry in entries)
+
 class MainTab:
+    MAX_LOG_LINES = 2000  # Older lines are dropped from the top of the log window
+    
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
@@ -21,12 +56,52 @@ class MainTab:
         self.is_running = False
         self.upload_queue = queue.Queue()
         self.progress_queue = queue.Queue()
+        self._progress_signalled = False
+        
+        # Widget updates for progress messages that carry a single latest value
+        self._progress_handlers = {
+            "current": self._set_current,
+            "queue": self._set_queue,
+            "active": self._set_active,
+            "progress": self._set_progress,
+        }
+        
+        # Messages that act on their own, applied in order after anything queued before them
+        self._event_handlers = {
+            "complete": lambda data: self.upload_complete(),
+            "scanning_started": self._on_scanning_started,
+            "scanning_failed": self._on_scanning_failed,
+            "file_detected": self._on_file_detected_tk,
+            "file_ready": self._process_rechecked_file,
+        }
+        
+        # Log lines waiting for the next idle flush into the log window
+        self._log_pending = deque()
+        self._log_flush_scheduled = False
+        self._last_ts = (None, "")  # (epoch second, "HH:MM:SS") of the last log line
         
         # Folder scanning variables
         self.folder_watcher = None
         self.scanning_active = False
         self.auto_process = tk.BooleanVar(value=True)
         
+        # Enabled platforms and configured upload manager, reset when settings change.
+        # Only read, built and reset on the Tk thread; workers are handed the manager
+        self._cached_platforms = None
+        self._cached_manager = None
+        self.app.add_config_listener(self.on_config_changed)
+        
+        # Files waiting for their text files, rechecked by one scheduler thread.
+        # Heap entries whose due time no longer matches _pending_by_stem are stale.
+        self._recheck_heap = []  # (due_time, file_path, attempts, DetectedFile)
+        self._pending_by_stem = {}  # video path without extension -> heap entry
+        self._recheck_cv = threading.Condition()
+        threading.Thread(target=self._recheck_loop, daemon=True).start()
+        
+        # Detected files are queued off the Tk thread; the semaphore caps how many are in progress
+        self._proc_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='process')
+        self._upload_sem = threading.BoundedSemaphore(10)
+        
         # Create GUI components
         self.create_widgets()
         self.start_progress_monitor()
@@ -114,9 +189,12 @@ class MainTab:
         log_frame = ttk.LabelFrame(self.frame, text="Log", padding=10)
         log_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=12, wrap=tk.WORD)
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=12, wrap=tk.WORD, undo=False)
         self.log_text.pack(fill='both', expand=True)
         
+        # Background threads post this event after queueing progress
+        self.frame.bind("<<ProgressUpdate>>", lambda e: self.drain_progress())
+        
     def browse_folder(self):
         """Open folder selection dialog"""
         folder = filedialog.askdirectory(title="Select Rendered Folder")
@@ -135,7 +213,7 @@ class MainTab:
             return
             
         # Check if any platforms are enabled
-        enabled_platforms = self.app.get_enabled_platforms()
+        enabled_platforms = self.get_enabled_platforms()
         if not enabled_platforms:
             messagebox.showwarning("Warning", "No platforms are enabled. Check Settings tab.")
             return
@@ -147,11 +225,12 @@ class MainTab:
         self.log_message("=== Starting upload process ===")
         self.log_message(f"Enabled platforms: {', '.join(enabled_platforms.keys())}")
         
-        # Start upload process in background thread
-        upload_thread = threading.Thread(target=self.upload_worker, daemon=True)
+        # Start upload process in background thread, with the manager set up here on the Tk thread
+        upload_thread = threading.Thread(target=self.upload_worker, args=(self.get_upload_manager(),),
+                                         daemon=True)
         upload_thread.start()
         
-    def upload_worker(self):
+    def upload_worker(self, upload_manager):
         """Background worker for upload process"""
         try:
             # Get file manager and scan folders
@@ -159,18 +238,11 @@ class MainTab:
             files = file_manager.scan_folders()
             
             if not files:
-                self.progress_queue.put(("log", "No video files found in selected folders"))
-                self.progress_queue.put(("complete", None))
+                self.upload_progress_callback("log", "No video files found in selected folders")
+                self.upload_progress_callback("complete", None)
                 return
                 
-            self.progress_queue.put(("log", f"Found {len(files)} files to process"))
-            
-            # Get upload manager and start uploads
-            upload_manager = self.app.get_upload_manager()
-            upload_manager.set_progress_callback(self.upload_progress_callback)
-            
-            enabled_platforms = self.app.get_enabled_platforms()
-            upload_manager.set_enabled_platforms(enabled_platforms)
+            self.upload_progress_callback("log", f"Found {len(files)} files to process")
             
             # Add files to queue and start uploads
             for file_info in files:
@@ -179,13 +251,41 @@ class MainTab:
             upload_manager.start_uploads()
             
         except Exception as e:
-            self.progress_queue.put(("error", f"Upload error: {str(e)}"))
-            self.progress_queue.put(("complete", None))
-            
+            self.upload_progress_callback("error", f"Upload error: {str(e)}")
+            self.upload_progress_callback("complete", None)
+            
+    def get_enabled_platforms(self):
+        """Enabled platforms, read from the Settings tab once per settings change (Tk thread only)"""
+        if self._cached_platforms is None:
+            self._cached_platforms = self.app.get_enabled_platforms()
+        return self._cached_platforms
+        
+    def get_upload_manager(self):
+        """Upload manager set up with our callback and the current platforms (Tk thread only)"""
+        if self._cached_manager is None:
+            upload_manager = self.app.get_upload_manager()
+            upload_manager.set_progress_callback(self.upload_progress_callback)
+            upload_manager.set_enabled_platforms(self.get_enabled_platforms())
+            self._cached_manager = upload_manager
+        return self._cached_manager
+        
+    def on_config_changed(self):
+        """Drop cached platform settings so the next upload picks up the change"""
+        self._cached_platforms = None
+        self._cached_manager = None
+        
     def upload_progress_callback(self, message_type, data):
         """Callback for upload progress updates"""
         self.progress_queue.put((message_type, data))
         
+        # Wake the GUI thread once per batch instead of waiting for the next poll
+        if not self._progress_signalled:
+            self._progress_signalled = True
+            try:
+                self.frame.event_generate("<<ProgressUpdate>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                pass  # Window closing; the fallback poll or shutdown handles it
+        
     def abort_uploads(self):
         """Stop all uploads"""
         if self.app.upload_manager:
@@ -201,31 +301,63 @@ class MainTab:
         self.monitor_progress()
         
     def monitor_progress(self):
-        """Monitor progress queue and update GUI"""
+        """Fallback poll of the progress queue in case a wakeup event was missed"""
+        self.drain_progress()
+        self.frame.after(1000, self.monitor_progress)
+        
+    def drain_progress(self):
+        """Drain the progress queue and update GUI"""
+        self._progress_signalled = False
+        
+        # Drain everything queued, keeping only the latest value per label
+        latest = {}
+        logs = []
         try:
             while True:
                 message_type, data = self.progress_queue.get_nowait()
                 
                 if message_type == "log":
-                    self.log_message(data)
-                elif message_type == "current":
-                    self.current_label.config(text=f"Current: {data}")
-                elif message_type == "queue":
-                    self.queue_label.config(text=f"Queue: {data} files remaining")
-                elif message_type == "active":
-                    self.active_label.config(text=f"Active: {data}")
-                elif message_type == "progress":
-                    self.progress_var.set(data)
-                elif message_type == "complete":
-                    self.upload_complete()
+                    logs.append(data)
                 elif message_type == "error":
-                    self.log_message(f"ERROR: {data}")
+                    logs.append(f"ERROR: {data}")
+                elif message_type in self._event_handlers:
+                    self.apply_progress(latest, logs)
+                    latest, logs = {}, []
+                    self._event_handlers[message_type](data)
+                else:
+                    latest[message_type] = data
                     
         except queue.Empty:
             pass
             
-        # Schedule next check
-        self.frame.after(100, self.monitor_progress)
+        self.apply_progress(latest, logs)
+        
+    def apply_progress(self, latest, logs):
+        """Apply a drained batch of progress updates, one widget update each"""
+        if logs:
+            self.log_messages(logs)
+            
+        handlers = self._progress_handlers
+        for message_type, data in latest.items():
+            handler = handlers.get(message_type)
+            if handler:
+                handler(data)
+                
+    def _set_current(self, data):
+        """Show the file currently uploading"""
+        self.current_label.config(text=f"Current: {data}")
+        
+    def _set_queue(self, data):
+        """Show how many files are left"""
+        self.queue_label.config(text=f"Queue: {data} files remaining")
+        
+    def _set_active(self, data):
+        """Show the active upload count"""
+        self.active_label.config(text=f"Active: {data}")
+        
+    def _set_progress(self, data):
+        """Move the progress bar"""
+        self.progress_var.set(data)
         
     def upload_complete(self):
         """Handle upload completion"""
@@ -238,16 +370,57 @@ class MainTab:
         
     def log_message(self, message):
         """Add message to log window"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"{timestamp} - {message}\n"
-        
-        self.log_text.insert(tk.END, formatted_message)
-        self.log_text.see(tk.END)
-        self.log_text.update()
+        timestamp = self._timestamp()
+        
+        self._log_pending.append(f"{timestamp} - {message}\n")
+        self._schedule_log_flush()
+        
+    def log_messages(self, messages):
+        """Add several messages to the log window in one insert"""
+        timestamp = self._timestamp()
+        
+        self._log_pending.extend(f"{timestamp} - {message}\n" for message in messages)
+        self._schedule_log_flush()
+        
+    def _timestamp(self):
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        last_second, text = self._last_ts
+        if now != last_second:
+            text = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_ts = (now, text)
+        return text
+        
+    def _schedule_log_flush(self):
+        """Flush pending log lines the next time Tk is idle, once per burst"""
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.frame.after_idle(self._flush_log)
+            
+    def _flush_log(self):
+        """Write all pending log lines with one insert"""
+        self._log_flush_scheduled = False
+        
+        lines = []
+        while self._log_pending:
+            lines.append(self._log_pending.popleft())
+            
+        if lines:
+            self.log_text.insert(tk.END, "".join(lines))
+            self.trim_log()
+            self.log_text.see(tk.END)
+        
+    def trim_log(self):
+        """Keep the log window at MAX_LOG_LINES so inserts don't slow down over time"""
+        # Every message ends in a newline, so the last line is always empty
+        lines = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        excess = lines - self.MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
         
     def clear_log(self):
         """Clear the log window"""
+        self._log_pending.clear()
         self.log_text.delete(1.0, tk.END)
         
     # Folder Scanning Methods
@@ -258,44 +431,65 @@ class MainTab:
             messagebox.showerror("Error", "Please select a folder first")
             return
         
+        # Watcher setup touches the disk (and maybe a network share), so keep it off the Tk thread
+        self.scanning_status.set("Starting...")
+        self.scanning_status_label.config(foreground="orange")
+        self.start_scanning_btn.config(state="disabled")
+        
+        threading.Thread(target=self._start_scanning_bg, args=(self.folder_path.get(),),
+                         daemon=True).start()
+        
+    def _start_scanning_bg(self, folder):
+        """Create and start the folder watcher, reporting back through the progress queue"""
         try:
             from core.folder_watcher import FolderWatcher
             
-            self.folder_watcher = FolderWatcher(
-                self.folder_path.get(), 
-                self.on_file_detected
+            folder_watcher = FolderWatcher(
+                folder, 
+                self.on_file_detected,
+                sidecar_callback=self.on_sidecar_detected
             )
             
             # Create missing folders if needed
-            created_folders = self.folder_watcher.create_missing_folders()
+            created_folders = folder_watcher.create_missing_folders()
             if created_folders:
-                self.log_message(f"Created missing folders: {', '.join([os.path.basename(f) for f in created_folders])}")
-            
-            self.folder_watcher.start_watching()
+                self.upload_progress_callback("log", f"Created missing folders: {', '.join([os.path.basename(f) for f in created_folders])}")
             
-            # Update GUI
-            self.scanning_status.set("Scanning...")
-            self.scanning_status_label.config(foreground="green")
-            self.start_scanning_btn.config(state="disabled")
-            self.stop_scanning_btn.config(state="normal")
-            self.scanning_active = True
-            
-            # Add to log
-            self.log_message("=== Started folder scanning - ready to process files as they appear ===")
+            folder_watcher.start_watching()
+            self.folder_watcher = folder_watcher
             
-            # Show watch status
-            status = self.folder_watcher.get_watch_status()
-            for folder_name, folder_info in status['folders'].items():
-                if folder_info['monitoring']:
-                    self.log_message(f"✓ Monitoring: {folder_name}")
-                elif folder_info['exists']:
-                    self.log_message(f"⚠ Folder exists but not monitoring: {folder_name}")
-                else:
-                    self.log_message(f"✗ Folder missing: {folder_name}")
+            self.upload_progress_callback("scanning_started", folder_watcher.get_watch_status())
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to start scanning: {e}")
-            self.log_message(f"ERROR: Failed to start scanning: {e}")
+            self.upload_progress_callback("scanning_failed", e)
+            
+    def _on_scanning_started(self, status):
+        """Update the GUI once the folder watcher is running"""
+        self.scanning_status.set("Scanning...")
+        self.scanning_status_label.config(foreground="green")
+        self.stop_scanning_btn.config(state="normal")
+        self.scanning_active = True
+        
+        # Add to log
+        self.log_message("=== Started folder scanning - ready to process files as they appear ===")
+        
+        # Show watch status
+        for folder_name, folder_info in status['folders'].items():
+            if folder_info['monitoring']:
+                self.log_message(f"✓ Monitoring: {folder_name}")
+            elif folder_info['exists']:
+                self.log_message(f"⚠ Folder exists but not monitoring: {folder_name}")
+            else:
+                self.log_message(f"✗ Folder missing: {folder_name}")
+                
+    def _on_scanning_failed(self, error):
+        """Reset the scanning controls after the watcher failed to start"""
+        self.scanning_status.set("Stopped")
+        self.scanning_status_label.config(foreground="red")
+        self.start_scanning_btn.config(state="normal")
+        
+        messagebox.showerror("Error", f"Failed to start scanning: {error}")
+        self.log_message(f"ERROR: Failed to start scanning: {error}")
 
     def stop_scanning(self):
         """Stop folder scanning"""
@@ -319,147 +513,146 @@ class MainTab:
             self.log_message(f"ERROR: Failed to stop scanning: {e}")
 
     def on_file_detected(self, file_path, folder_type):
-        """Called when folder watcher detects a new file"""
+        """Called when folder watcher detects a new file (runs on the watcher's callback thread)"""
+        # Tk state is only touched on the Tk thread, so hand the file over through the progress queue
+        self.upload_progress_callback("file_detected", DetectedFile(file_path, folder_type))
         
+    def _on_file_detected_tk(self, detected):
+        """Log a detected file and queue it for processing if auto-process is on (runs on the Tk thread)"""
         # Add to log
-        filename = os.path.basename(file_path)
-        self.log_message(f"🎬 Detected new file: {filename} in {folder_type} folder")
+        self.log_message(f"🎬 Detected new file: {detected.filename} in {detected.folder_type} folder")
         
-        # Auto-process if enabled
+        # Auto-process if enabled; the setting and manager are read here, the disk checks run on the pool
         if self.auto_process.get():
-            # Check if file has required text files
-            if self.validate_file_requirements(file_path):
-                self.log_message(f"📤 Auto-processing: {filename}")
-                self.process_single_file(file_path, folder_type)
-            else:
-                self.log_message(f"⏳ Waiting for text files for: {filename}")
-                # Set up a timer to check again later
-                self.schedule_recheck(file_path, folder_type)
+            self._proc_pool.submit(self._auto_process_file, detected, self.get_upload_manager())
+            
+    def _auto_process_file(self, detected, upload_manager):
+        """Queue a detected file once its text files are there (runs on the processing pool)"""
+        # Check if file has required text files
+        if self.validate_file_requirements(detected):
+            self.upload_progress_callback("log", f"📤 Auto-processing: {detected.filename}")
+            self._process_single_file(detected, upload_manager)
+        else:
+            self.upload_progress_callback("log", f"⏳ Waiting for text files for: {detected.filename}")
+            # Set up a timer to check again later
+            self.schedule_recheck(detected)
 
-    def validate_file_requirements(self, file_path):
+    def validate_file_requirements(self, detected):
         """Check if video file has required text files"""
-        base_name = os.path.splitext(file_path)[0]
+        # One directory read serves every sibling check until the folder changes
+        try:
+            entries = _dir_entries(detected.parent, os.stat(detected.parent).st_mtime_ns)
+        except OSError:
+            return False
+            
+        def has(name):
+            # Coarse mtimes can hide a file created right after the listing, so only hits are trusted
+            return name in entries or os.path.exists(os.path.join(detected.parent, name))
         
         # Check for TITLE.txt
-        title_file = base_name + "_TITLE.txt"
-        if not os.path.exists(title_file):
+        if not has(detected.title_file):
             return False
         
         # Check for folder-specific requirements
-        folder_type = self.folder_watcher.get_folder_type(file_path) if self.folder_watcher else "unknown"
-        
-        if folder_type == "cloudflare":
-            desc_file = base_name + "_DESCRIPTION.txt"
-            return os.path.exists(desc_file)
-        elif folder_type == "youtube_shorts":
-            short_desc_file = base_name + "_SHORT_DESC.txt"
-            return os.path.exists(short_desc_file)
+        if detected.folder_type == "cloudflare":
+            return has(detected.desc_file)
+        elif detected.folder_type == "youtube_shorts":
+            return has(detected.short_desc_file)
         
         return True
 
-    def schedule_recheck(self, file_path, folder_type, attempts=0):
+    def schedule_recheck(self, detected, attempts=0):
         """Schedule a recheck for files missing text files"""
         max_attempts = 10  # Check for up to 50 minutes (5 min intervals)
         
         if attempts >= max_attempts:
-            filename = os.path.basename(file_path)
-            self.log_message(f"⚠ Giving up on {filename} - text files not found after {max_attempts * 5} minutes")
+            with self._recheck_cv:
+                self._pending_by_stem.pop(detected.base_name, None)
+            self.upload_progress_callback("log", f"⚠ Giving up on {detected.filename} - text files not found after {max_attempts * 5} minutes")
             return
         
-        # Check again in 5 minutes
-        def recheck():
-            if self.validate_file_requirements(file_path):
-                filename = os.path.basename(file_path)
-                self.log_message(f"✅ Text files found! Processing: {filename}")
-                self.process_single_file(file_path, folder_type)
-            else:
-                self.schedule_recheck(file_path, folder_type, attempts + 1)
-        
-        # Schedule the recheck
-        threading.Timer(300, recheck).start()  # 300 seconds = 5 minutes
-
-    def process_single_file(self, file_path, folder_type):
-        """Process a single file for upload"""
-        try:
-            # Create file info object similar to what FileManager creates
-            file_info = self.create_file_info(file_path, folder_type)
-            
-            # Get upload manager and add to queue
-            upload_manager = self.app.get_upload_manager()
-            upload_manager.set_progress_callback(self.upload_progress_callback)
+        # Check again in 5 minutes, or sooner if a text file shows up
+        self._push_recheck(detected, attempts, 300)
+        
+    def _push_recheck(self, detected, attempts, delay):
+        """Queue the next recheck for a file, replacing any earlier one"""
+        entry = (time.time() + delay, detected.path, attempts, detected)
+        with self._recheck_cv:
+            self._pending_by_stem[detected.base_name] = entry
+            heapq.heappush(self._recheck_heap, entry)
+            self._recheck_cv.notify()
+            
+    def on_sidecar_detected(self, sidecar_path):
+        """Recheck a waiting video soon after one of its text files appears"""
+        from core.folder_watcher import SIDECAR_SUFFIXES
+        
+        for suffix in SIDECAR_SUFFIXES:
+            if sidecar_path.endswith(suffix):
+                base_name = sidecar_path[:-len(suffix)]
+                break
+        else:
+            return
             
-            enabled_platforms = self.app.get_enabled_platforms()
-            upload_manager.set_enabled_platforms(enabled_platforms)
+        with self._recheck_cv:
+            pending = self._pending_by_stem.get(base_name)
+        if pending is None:
+            return
             
-            # Add to upload queue
-            upload_manager.add_single_file(file_path, folder_type)
+        # A short delay lets the writer finish and folds bursts of events into one check
+        _, _, attempts, detected = pending
+        self._push_recheck(detected, attempts, 2)
             
-            # Start upload if not already running
-            if not upload_manager.is_running:
-                upload_manager.start_uploads()
+    def _recheck_loop(self):
+        """Run due rechecks, sleeping until the earliest one"""
+        while True:
+            with self._recheck_cv:
+                while not self._recheck_heap:
+                    self._recheck_cv.wait()
+                    
+                delay = self._recheck_heap[0][0] - time.time()
+                if delay > 0:
+                    self._recheck_cv.wait(delay)
+                    continue
+                    
+                entry = heapq.heappop(self._recheck_heap)
+                _, _, attempts, detected = entry
                 
-        except Exception as e:
-            filename = os.path.basename(file_path)
-            self.log_message(f"ERROR: Failed to process {filename}: {e}")
-
-    def create_file_info(self, file_path, folder_type):
-        """Create file info object from a single file"""
-        try:
-            # Get file manager to extract metadata
-            file_manager = self.app.get_file_manager(self.folder_path.get())
-            
-            # Extract metadata for this single file
-            base_name = os.path.splitext(file_path)[0]
-            
-            # Read text files
-            title = self.read_text_file(base_name + "_TITLE.txt")
-            description = self.read_text_file(base_name + "_DESCRIPTION.txt") 
-            short_desc = self.read_text_file(base_name + "_SHORT_DESC.txt")
-            
-            # Create file info object
-            from core.file_manager import FileInfo
-            
-            file_info = FileInfo(
-                path=file_path,
-                filename=os.path.basename(file_path),
-                title=title or os.path.splitext(os.path.basename(file_path))[0],
-                description=description,
-                short_description=short_desc,
-                platforms=self.get_target_platforms_for_file(file_path, folder_type)
-            )
-            
-            return file_info
-            
-        except Exception as e:
-            raise Exception(f"Failed to create file info: {e}")
-
-    def read_text_file(self, file_path):
-        """Read text file content, return None if file doesn't exist"""
-        try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-        except:
-            pass
-        return None
+                if self._pending_by_stem.get(detected.base_name) != entry:
+                    continue  # Superseded by a newer recheck
+                    
+            try:
+                if self.validate_file_requirements(detected):
+                    with self._recheck_cv:
+                        self._pending_by_stem.pop(detected.base_name, None)
+                    # Tk calls aren't safe from this thread, the progress queue takes it to the Tk thread
+                    self.upload_progress_callback("file_ready", detected)
+                else:
+                    self.schedule_recheck(detected, attempts + 1)
+            except Exception as e:
+                log.error("Recheck error for %s: %s", detected.path, e)
+                
+    def _process_rechecked_file(self, detected):
+        """Process a file whose text files have arrived (runs on the Tk thread)"""
+        self.log_message(f"✅ Text files found! Processing: {detected.filename}")
+        self.process_single_file(detected)
 
-    def get_target_platforms_for_file(self, file_path, folder_type):
-        """Determine which platforms this file should be uploaded to"""
-        platforms = []
-        filename = os.path.basename(file_path)
-        
-        if folder_type == 'cloudflare':
-            # Always upload to CloudFlare and Facebook
-            platforms.extend(['cloudflare', 'facebook'])
-            
-            # Upload "001" files to YouTube as well
-            if "001" in filename:
-                platforms.append('youtube')
+    def process_single_file(self, detected):
+        """Process a single file for upload in the background"""
+        # Set up here; Tk variables must not be touched from the pool
+        upload_manager = self.get_upload_manager()
+        self._proc_pool.submit(self._process_single_file, detected, upload_manager)
+        
+    def _process_single_file(self, detected, upload_manager):
+        """Queue a single file for upload (runs on the processing pool)"""
+        with self._upload_sem:
+            try:
+                # Add to upload queue; the manager reads the three text files concurrently,
+                # so they aren't read here first as well
+                upload_manager.add_single_file(detected.path, detected.folder_type)
                 
-        elif folder_type == 'pinterest':
-            platforms.append('pinterest')
-            
-        elif folder_type == 'youtube_shorts':
-            platforms.append('youtube_shorts')
-        
-        return platforms 
\ No newline at end of file
+                # Start upload if not already running
+                if not upload_manager.is_running:
+                    upload_manager.start_uploads()
+                    
+            except Exception as e:
+                self.upload_progress_callback("error", f"Failed to process {detected.filename}: {e}")
@@ -4,12 +4,20 @@ Schedule Tab - Scheduling functionality for Video Upload Automation
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import schedule
 import threading
 import time
+from collections import deque
 from datetime import datetime, timedelta
 
+_HALF_HOUR_SLOTS = tuple(f"{h:02d}:{m:02d}" for h in range(24) for m in (0, 30))
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_WEEKDAY_INDEX = {day: index for index, day in enumerate(_WEEKDAYS)}  # matches datetime.weekday()
+_FB_DELAYS = (1, 7, 14, 21, 30, 45, 60, 90)
+_MAX_SCHEDULER_SLEEP = 60  # Seconds; the wall clock is re-read at least this often
+
 class ScheduleTab:
+    MAX_LOG_LINES = 1000
+    
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
@@ -18,16 +26,24 @@ class ScheduleTab:
         # Scheduling variables
         self.schedule_type = tk.StringVar(value="manual")
         self.schedule_time = tk.StringVar(value="14:00")
-        self.schedule_day = tk.StringVar(value="Monday")
-        self.facebook_delay_days = tk.IntVar(value=30)
         self.auto_retry = tk.BooleanVar(value=True)
-        self.scheduling_enabled = tk.BooleanVar(value=False)
+        self.scheduling_enabled = False
         
         # Scheduler state
         self.scheduler_thread = None
-        self.scheduler_running = False
+        self._stop_event = threading.Event()
+        self._scheduler_wake = threading.Event()
         self.next_run_time = None
+        self.run_interval = None
         self.last_run_time = None
+        self._status_after_id = None
+        self._last_next_text = None
+        self._last_countdown = (None, None)  # (minute, next run) last rendered
+        
+        # Log lines waiting for the next idle flush
+        self._log_queue = deque()
+        self._log_flush_scheduled = False
+        self._scroll_pending = False
         
         # Create GUI components
         self.create_widgets()
@@ -52,7 +68,7 @@ class ScheduleTab:
                        variable=self.schedule_type, value="daily").pack(side='left')
         
         time_combo = ttk.Combobox(daily_frame, textvariable=self.schedule_time, width=8)
-        time_combo['values'] = [f"{h:02d}:{m:02d}" for h in range(24) for m in [0, 30]]
+        time_combo['values'] = _HALF_HOUR_SLOTS
         time_combo.pack(side='left', padx=5)
         
         # Weekly option
@@ -61,14 +77,15 @@ class ScheduleTab:
         ttk.Radiobutton(weekly_frame, text="Run Weekly on:", 
                        variable=self.schedule_type, value="weekly").pack(side='left')
         
-        day_combo = ttk.Combobox(weekly_frame, textvariable=self.schedule_day, width=10)
-        day_combo['values'] = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day_combo.pack(side='left', padx=5)
+        self.day_combo = ttk.Combobox(weekly_frame, width=10)
+        self.day_combo['values'] = _WEEKDAYS
+        self.day_combo.set("Monday")
+        self.day_combo.pack(side='left', padx=5)
         
         ttk.Label(weekly_frame, text="at").pack(side='left', padx=2)
         
         weekly_time_combo = ttk.Combobox(weekly_frame, textvariable=self.schedule_time, width=8)
-        weekly_time_combo['values'] = [f"{h:02d}:{m:02d}" for h in range(24) for m in [0, 30]]
+        weekly_time_combo['values'] = _HALF_HOUR_SLOTS
         weekly_time_combo.pack(side='left', padx=5)
         
         # Custom schedule option
@@ -81,9 +98,10 @@ class ScheduleTab:
         fb_frame = ttk.Frame(options_frame)
         fb_frame.pack(fill='x', pady=5)
         ttk.Label(fb_frame, text="Facebook Post Delay:").pack(side='left')
-        delay_combo = ttk.Combobox(fb_frame, textvariable=self.facebook_delay_days, width=8)
-        delay_combo['values'] = [1, 7, 14, 21, 30, 45, 60, 90]
-        delay_combo.pack(side='left', padx=5)
+        self.delay_combo = ttk.Combobox(fb_frame, width=8)
+        self.delay_combo['values'] = _FB_DELAYS
+        self.delay_combo.set(30)
+        self.delay_combo.pack(side='left', padx=5)
         ttk.Label(fb_frame, text="days").pack(side='left')
         
         # Auto-retry option
@@ -123,7 +141,7 @@ class ScheduleTab:
         log_frame = ttk.LabelFrame(self.frame, text="Schedule Log", padding=10)
         log_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.log_text = tk.Text(log_frame, height=8, wrap=tk.WORD)
+        self.log_text = tk.Text(log_frame, height=8, wrap=tk.WORD, undo=False)
         log_scrollbar = ttk.Scrollbar(log_frame, orient='vertical', command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=log_scrollbar.set)
         
@@ -137,14 +155,14 @@ class ScheduleTab:
             return
             
         try:
-            self.scheduling_enabled.set(True)
+            self.scheduling_enabled = True
             self.setup_scheduler()
             
             self.enable_button.config(state='disabled')
             self.disable_button.config(state='normal')
             
             self.log_message("Scheduling enabled")
-            self.update_next_run_display()
+            self.start_status_updater()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to enable scheduling: {str(e)}")
@@ -152,13 +170,13 @@ class ScheduleTab:
     def disable_scheduling(self):
         """Disable automatic scheduling"""
         try:
-            self.scheduling_enabled.set(False)
+            self.scheduling_enabled = False
             self.stop_scheduler()
             
             self.enable_button.config(state='normal')
             self.disable_button.config(state='disabled')
             
-            self.next_run_label.config(text="Next Run: Not scheduled")
+            self.start_status_updater()
             self.log_message("Scheduling disabled")
             
         except Exception as e:
@@ -185,65 +203,94 @@ class ScheduleTab:
             
     def setup_scheduler(self):
         """Set up the scheduler based on selected options"""
-        schedule.clear()  # Clear any existing schedules
-        
         schedule_time = self.schedule_time.get()
+        hour, minute = map(int, schedule_time.split(':'))
+        now = datetime.now()
+        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
         
         if self.schedule_type.get() == "daily":
-            schedule.every().day.at(schedule_time).do(self.scheduled_upload)
+            interval = timedelta(days=1)
             self.log_message(f"Scheduled daily upload at {schedule_time}")
             
         elif self.schedule_type.get() == "weekly":
-            day = self.schedule_day.get().lower()
-            getattr(schedule.every(), day).at(schedule_time).do(self.scheduled_upload)
-            self.log_message(f"Scheduled weekly upload on {self.schedule_day.get()} at {schedule_time}")
+            day = self.day_combo.get()
+            interval = timedelta(days=7)
+            next_run += timedelta(days=(_WEEKDAY_INDEX[day] - now.weekday()) % 7)
+            self.log_message(f"Scheduled weekly upload on {day} at {schedule_time}")
             
         elif self.schedule_type.get() == "custom":
             # For custom schedules, you could add more complex logic here
             self.log_message("Custom schedule not yet implemented")
             return
             
-        # Start scheduler thread
-        if not self.scheduler_running:
-            self.scheduler_running = True
-            self.scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
+        if next_run <= now:
+            next_run += interval
+        self.run_interval = interval
+        self.next_run_time = next_run
+        
+        # Start scheduler thread, or wake it so it picks up the new next run
+        if self.scheduler_thread is None:
+            # Fresh events per thread so a stopped thread can't be revived by a quick re-enable
+            self._stop_event = threading.Event()
+            self._scheduler_wake = threading.Event()
+            self.scheduler_thread = threading.Thread(target=self.run_scheduler,
+                                                     args=(self._stop_event, self._scheduler_wake),
+                                                     daemon=True)
             self.scheduler_thread.start()
+        else:
+            self._scheduler_wake.set()
+            
+    def run_scheduler(self, stop_event, wake):
+        """Run the scheduler in a background thread, sleeping until the next job is due"""
+        while not stop_event.is_set():
+            next_run = self.next_run_time
+            now = datetime.now()
+            if next_run is None or next_run > now:
+                # Block until the next fire time, setup/stop wake us early. Waits are capped
+                # so a suspend or clock change (DST) is noticed within a minute
+                timeout = None if next_run is None else min((next_run - now).total_seconds(), _MAX_SCHEDULER_SLEEP)
+                wake.wait(timeout)
+                wake.clear()
+                continue
+                
+            # Skip any runs missed while the machine was asleep
+            while next_run <= now:
+                next_run += self.run_interval
+            self.next_run_time = next_run
             
-    def run_scheduler(self):
-        """Run the scheduler in a background thread"""
-        while self.scheduler_running and self.scheduling_enabled.get():
             try:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                self.scheduled_upload()
             except Exception as e:
                 self.log_message(f"Scheduler error: {str(e)}")
-                time.sleep(60)
                 
     def stop_scheduler(self):
         """Stop the scheduler"""
-        self.scheduler_running = False
-        schedule.clear()
+        self._stop_event.set()
+        self._scheduler_wake.set()
+        self.scheduler_thread = None
+        self.next_run_time = None
         
     def scheduled_upload(self):
         """Perform scheduled upload"""
         try:
             self.log_message("Starting scheduled upload")
+            app = self.app
             
             # Check if main tab has a folder selected
-            main_tab = self.app.main_tab
-            if not main_tab.folder_path.get():
+            folder = app.main_tab.folder_path.get()
+            if not folder:
                 self.log_message("ERROR: No folder selected for upload")
                 return
                 
             # Check if any platforms are enabled
-            enabled_platforms = self.app.get_enabled_platforms()
+            enabled_platforms = app.get_enabled_platforms()
             if not enabled_platforms:
                 self.log_message("ERROR: No platforms enabled")
                 return
                 
             # Trigger upload process
             # Note: This runs in the scheduler thread, so we need to be careful with GUI updates
-            self.app.root.after(0, self.trigger_main_upload)
+            app.root.after(0, self.trigger_main_upload)
             
             self.last_run_time = datetime.now()
             
@@ -253,30 +300,56 @@ class ScheduleTab:
     def trigger_main_upload(self):
         """Trigger upload from main tab (called from GUI thread)"""
         try:
-            main_tab = self.app.main_tab
-            main_tab.run_uploads()
+            self.app.main_tab.run_uploads()
             self.update_last_run_display()
+            # The scheduler thread has already advanced next_run_time past this run
+            self.update_next_run_display()
         except Exception as e:
             self.log_message(f"Error triggering upload: {str(e)}")
             
     def start_status_updater(self):
-        """Start periodic status updates"""
+        """Refresh the next run display, re-arming only while scheduling is enabled"""
+        if self._status_after_id is not None:
+            self.frame.after_cancel(self._status_after_id)
+            self._status_after_id = None
+            
         self.update_next_run_display()
-        self.frame.after(60000, self.start_status_updater)  # Update every minute
-        
+        if not self.scheduling_enabled:
+            return
+            
+        # The countdown only changes on minute boundaries
+        ms_until_next_minute = 60000 - int(time.time() * 1000) % 60000
+        self._status_after_id = self.frame.after(ms_until_next_minute, self.start_status_updater)
+        
+    def set_next_run_text(self, text):
+        """Update the next run label only when its text changes"""
+        if text != self._last_next_text:
+            self._last_next_text = text
+            self.next_run_label.config(text=text)
+            
     def update_next_run_display(self):
         """Update the next run time display"""
-        if not self.scheduling_enabled.get():
-            self.next_run_label.config(text="Next Run: Not scheduled")
+        if not self.scheduling_enabled:
+            self._last_countdown = (None, None)
+            self.set_next_run_text("Next Run: Not scheduled")
             return
             
         try:
-            next_run = schedule.next_run()
+            now = datetime.now()
+            next_run = self.next_run_time
+            
+            # Nothing to redraw until the minute or the next run changes
+            countdown = (now.replace(second=0, microsecond=0), next_run)
+            if countdown == self._last_countdown:
+                return
+            self._last_countdown = countdown
+            
             if next_run:
-                time_until = next_run - datetime.now()
-                days = time_until.days
-                hours, remainder = divmod(time_until.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
+                # Whole seconds only; a run that is just due counts as "in 0 minutes"
+                total = max(0, int((next_run - now).total_seconds()))
+                days, remainder = divmod(total, 86400)
+                hours, remainder = divmod(remainder, 3600)
+                minutes = remainder // 60
                 
                 if days > 0:
                     time_str = f"in {days} days, {hours} hours"
@@ -285,12 +358,13 @@ class ScheduleTab:
                 else:
                     time_str = f"in {minutes} minutes"
                     
-                self.next_run_label.config(text=f"Next Run: {next_run.strftime('%A %H:%M')} ({time_str})")
+                self.set_next_run_text(f"Next Run: {next_run.strftime('%A %H:%M')} ({time_str})")
             else:
-                self.next_run_label.config(text="Next Run: Not scheduled")
+                self.set_next_run_text("Next Run: Not scheduled")
                 
         except Exception as e:
-            self.next_run_label.config(text="Next Run: Error calculating")
+            self._last_countdown = (None, None)
+            self.set_next_run_text("Next Run: Error calculating")
             
     def update_last_run_display(self):
         """Update the last run time display"""
@@ -303,21 +377,59 @@ class ScheduleTab:
             
     def log_message(self, message):
         """Add message to schedule log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"{timestamp} - {message}\n"
+        timestamp = time.strftime("%H:%M:%S")
+        line = f"{timestamp} - {message}\n"
+        
+        if threading.current_thread() is not threading.main_thread():
+            # Tk isn't thread-safe; the scheduler thread hands the line to the GUI thread
+            self.app.root.after(0, self._queue_log_line, line)
+        else:
+            self._queue_log_line(line)
+            
+    def _queue_log_line(self, line):
+        """Queue a formatted line for the next idle flush (GUI thread only)"""
+        self._log_queue.append(line)
+        
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.frame.after_idle(self._flush_log)
+            
+    def _flush_log(self):
+        """Write all queued log lines with one insert"""
+        self._log_flush_scheduled = False
         
-        self.log_text.insert(tk.END, formatted_message)
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+            
+        if lines:
+            self.log_text.insert(tk.END, "".join(lines))
+            self.trim_log()
+            if not self._scroll_pending:
+                self._scroll_pending = True
+                self.frame.after_idle(self._do_scroll)
+                
+    def _do_scroll(self):
+        """Scroll the log to the newest line once per burst of flushes"""
+        self._scroll_pending = False
         self.log_text.see(tk.END)
-        self.log_text.update()
+            
+    def trim_log(self):
+        """Keep the log at MAX_LOG_LINES so a long-running schedule doesn't grow it forever"""
+        # Every message ends in a newline, so the last line is always empty
+        lines = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        excess = lines - self.MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
         
     def get_settings(self):
         """Get scheduling settings for saving"""
         return {
-            'enabled': self.scheduling_enabled.get(),
+            'enabled': self.scheduling_enabled,
             'schedule_type': self.schedule_type.get(),
             'schedule_time': self.schedule_time.get(),
-            'schedule_day': self.schedule_day.get(),
-            'facebook_delay_days': self.facebook_delay_days.get(),
+            'schedule_day': self.day_combo.get(),
+            'facebook_delay_days': self.get_facebook_delay_days(),
             'auto_retry': self.auto_retry.get()
         }
         
@@ -326,20 +438,24 @@ class ScheduleTab:
         try:
             scheduling = settings.get('scheduling', {})
             
-            self.scheduling_enabled.set(scheduling.get('enabled', False))
+            self.scheduling_enabled = bool(scheduling.get('enabled', False))
             self.schedule_type.set(scheduling.get('schedule_type', 'manual'))
             self.schedule_time.set(scheduling.get('schedule_time', '14:00'))
-            self.schedule_day.set(scheduling.get('schedule_day', 'Monday'))
-            self.facebook_delay_days.set(scheduling.get('facebook_delay_days', 30))
+            self.day_combo.set(scheduling.get('schedule_day', 'Monday'))
+            self.delay_combo.set(scheduling.get('facebook_delay_days', 30))
             self.auto_retry.set(scheduling.get('auto_retry', True))
             
-            # If scheduling was enabled, restart it
-            if self.scheduling_enabled.get() and self.schedule_type.get() != 'manual':
-                self.enable_scheduling()
+            # If scheduling was enabled, restart it; a live thread only needs its next run recomputed
+            if self.scheduling_enabled and self.schedule_type.get() != 'manual':
+                if self.scheduler_thread is not None and self.scheduler_thread.is_alive():
+                    self.setup_scheduler()
+                    self.start_status_updater()
+                else:
+                    self.enable_scheduling()
                 
         except Exception as e:
             print(f"Error loading schedule settings: {e}")
             
     def get_facebook_delay_days(self):
         """Get Facebook posting delay in days"""
-        return self.facebook_delay_days.get() 
\ No newline at end of file
+        return int(self.delay_combo.get()) 
\ No newline at end of file
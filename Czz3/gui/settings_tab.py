@@ -4,8 +4,236 @@ Settings Tab - Platform and API configuration for Video Upload Automation
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import importlib
+import queue
+import sys
 import threading
 import json
+import weakref
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from io import StringIO
+
+# Platform sections: (checkbox title, enabled variable, fields, footnote)
+# Each field is (label, variable, Entry options, extras); 'password' in the options picks a PasswordEntry.
+# Each extra is (text, method, argument), shown right of the entry as a button calling method(argument)
+# (method() when argument is None), or as a plain label when method is None
+_PLATFORM_SECTIONS = (
+    ("CloudFlare Stream", 'cloudflare_enabled', (
+        ("API Token:", 'cloudflare_token', {'password': True}, (("Test", 'test_api', 'cloudflare'),)),
+        ("Account ID:", 'cloudflare_account', {'width': 40}, ()),
+    ), None),
+    ("YouTube", 'youtube_enabled', (
+        ("Client ID:", 'youtube_client_id', {'width': 40}, (("Auth", 'youtube_auth', None),)),
+        ("Client Secret:", 'youtube_client_secret', {'password': True}, ()),
+        ("Refresh Token:", 'youtube_refresh_token', {'width': 40, 'state': 'readonly'}, (("Auto-generated", None, None),)),
+    ), None),
+    ("Pinterest", 'pinterest_enabled', (
+        ("Access Token:", 'pinterest_token', {'password': True}, (("Test", 'test_api', 'pinterest'),)),
+        ("Board ID:", 'pinterest_board_id', {'width': 40}, ()),
+    ), None),
+    ("Facebook", 'facebook_enabled', (
+        ("Access Token:", 'facebook_token', {'password': True, 'width': 35}, 
+         (("Test", 'test_api', 'facebook'), ("Help", 'show_facebook_help', None))),
+        ("Group ID:", 'facebook_group_id', {'width': 40}, ()),
+    ), "ℹ️ Requires: publish_to_groups + groups_access_member_info permissions"),
+)
+
+# Setting rows: (label, variable, widget kind, combo values or spin range, unit)
+_GENERAL_ROWS = (
+    ("Max Concurrent Uploads:", 'max_concurrent', 'combo', (1, 2, 3, 4, 5), None),
+    ("Retry Attempts:", 'retry_attempts', 'combo', (1, 2, 3, 4, 5), None),
+    ("Upload Timeout (seconds):", 'upload_timeout', 'entry', None, None),
+)
+_SCANNING_ROWS = (
+    ("File stability timeout:", 'stability_timeout', 'spin', (1, 10), "seconds"),
+    ("Text file recheck interval:", 'recheck_interval', 'spin', (1, 30), "minutes"),
+    ("Max recheck attempts:", 'max_attempts', 'spin', (1, 50), "attempts"),
+)
+
+# Credential that must be filled in for an enabled platform to be used
+_REQUIRED_CREDENTIAL = {
+    'cloudflare': 'api_token',
+    'youtube': 'client_id',
+    'pinterest': 'access_token',
+    'facebook': 'page_token',
+}
+
+_FACEBOOK_HELP_TEXT = """📋 FACEBOOK API PERMISSIONS SETUP GUIDE
+
+🔥 PROBLEM: Your Facebook token only has READ permissions!
+✅ SOLUTION: Get a token with WRITE permissions for video uploads.
+
+═══════════════════════════════════════════════════════════════
+
+🔑 REQUIRED PERMISSIONS:
+   • publish_to_groups - Post content to Facebook groups
+   • groups_access_member_info - Access group information
+
+📱 STEP-BY-STEP INSTRUCTIONS:
+
+1. 📖 Go to Facebook Graph API Explorer:
+   https://developers.facebook.com/tools/explorer/
+
+2. 🏗️ Create or Select Your App:
+   • If you don't have an app, create one at:
+     https://developers.facebook.com/apps/
+   • Select your app from the dropdown in Graph API Explorer
+
+3. 🎯 Generate Access Token:
+   • Click "Generate Access Token"
+   • Add these specific permissions:
+     ✓ publish_to_groups
+     ✓ groups_access_member_info
+   
+4. 👤 Important User Requirements:
+   • You must be logged in as a user who is:
+     ✓ A member of the target Facebook group
+     ✓ Has permission to post in the group
+     ✓ Preferably an admin/moderator of the group
+
+5. 📋 Copy the Generated Token:
+   • Copy the access token from Graph API Explorer
+   • Paste it into the "Access Token" field above
+
+═══════════════════════════════════════════════════════════════
+
+🛠️ ALTERNATIVE: PAGE ACCESS TOKEN
+
+If you want to post as a Facebook Page:
+
+1. Get a Page Access Token instead of User Access Token
+2. Required permissions:
+   • pages_manage_posts
+   • pages_read_engagement
+3. The page must be connected to/admin of the group
+
+═══════════════════════════════════════════════════════════════
+
+⚠️ COMMON ISSUES:
+
+❌ "Access forbidden" error:
+   → Your token lacks write permissions
+   → Regenerate token with publish_to_groups permission
+
+❌ "Group not found" error:
+   → Check your Group ID is correct
+   → Make sure you're a member of the group
+
+❌ "Upload forbidden" error:
+   → Group settings may restrict video uploads
+   → You may need admin approval for posts
+   → Check if you're banned/restricted in the group
+
+❌ "Invalid token" error:
+   → Token may have expired
+   → Regenerate a new access token
+
+═══════════════════════════════════════════════════════════════
+
+🔍 HOW TO FIND YOUR GROUP ID:
+
+1. Go to your Facebook group
+2. Look at the URL: facebook.com/groups/[GROUP_ID]
+3. Or use Graph API Explorer:
+   • Search: me/groups
+   • Find your group in the results
+
+═══════════════════════════════════════════════════════════════
+
+💡 TESTING TIPS:
+
+✅ Use the "Test" button to verify:
+   • Token permissions are correct
+   • You can access the group
+   • Video upload permissions work
+
+✅ If test passes, you're ready to upload videos!
+
+═══════════════════════════════════════════════════════════════
+
+🔐 SECURITY NOTE:
+
+• Keep your access token private
+• Tokens can expire - you may need to regenerate them
+• Use User tokens for personal posting
+• Use Page tokens for business/page posting
+
+═══════════════════════════════════════════════════════════════
+
+Need more help? Check Facebook's Developer Documentation:
+https://developers.facebook.com/docs/graph-api/reference/group/videos/
+"""
+
+# API client classes per platform, imported on first use so startup doesn't pay for requests/oauth
+_API_CLASSES = {
+    'cloudflare': ('api.cloudflare', 'CloudFlareAPI'),
+    'youtube': ('api.youtube', 'YouTubeAPI'),
+    'pinterest': ('api.pinterest', 'PinterestAPI'),
+    'facebook': ('api.facebook', 'FacebookAPI'),
+}
+
+@lru_cache(maxsize=None)
+def _api_class(platform):
+    """Return a platform's API client class, importing its module only once"""
+    module_name, class_name = _API_CLASSES[platform]
+    return getattr(importlib.import_module(module_name), class_name)
+
+class PasswordEntry(ttk.Entry):
+    """Entry that masks its contents, for API tokens and secrets"""
+    
+    def __init__(self, master=None, **kw):
+        kw.setdefault('show', '*')
+        kw.setdefault('width', 40)
+        super().__init__(master, **kw)
+
+def _is_digits(proposed):
+    """Spinbox key validation: allow only digits, or an empty field while editing"""
+    return proposed == '' or proposed.isdigit()
+
+class _ThreadLocalStdout:
+    """sys.stdout stand-in that sends a thread's prints to its capture buffer, if it has one"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            return buffer.write(text)
+        # Under pythonw there is no console stream, uncaptured prints go nowhere
+        if self._stream is None:
+            return len(text)
+        return self._stream.write(text)
+        
+    def flush(self):
+        if self._stream is not None:
+            self._stream.flush()
+            
+    def __getattr__(self, name):
+        if self._stream is None:
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+_stdout_lock = threading.Lock()
+
+@contextmanager
+def _capture_stdout():
+    """Collect the calling thread's print output without touching other threads' output"""
+    with _stdout_lock:
+        if not isinstance(sys.stdout, _ThreadLocalStdout):
+            sys.stdout = _ThreadLocalStdout(sys.stdout)
+        stdout = sys.stdout
+        
+    buffer = StringIO()
+    stdout._local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        stdout._local.buffer = None
 
 class SettingsTab:
     def __init__(self, parent, app):
@@ -33,57 +261,133 @@ class SettingsTab:
         self.facebook_token = tk.StringVar()
         self.facebook_group_id = tk.StringVar()
         
+        # Let the rest of the app know when platform settings change
+        for var in (self.cloudflare_enabled, self.youtube_enabled, self.pinterest_enabled,
+                    self.facebook_enabled, self.cloudflare_token, self.cloudflare_account,
+                    self.youtube_client_id, self.youtube_client_secret, self.youtube_refresh_token,
+                    self.pinterest_token, self.pinterest_board_id,
+                    self.facebook_token, self.facebook_group_id):
+            var.trace_add('write', self._on_platform_setting_changed)
+        
         # General settings variables
-        self.max_concurrent = tk.IntVar(value=3)
-        self.retry_attempts = tk.IntVar(value=3)
+        # Readonly combobox choices are plain ints, updated when the user picks a value
+        self.max_concurrent = 3
+        self.retry_attempts = 3
+        self._choice_combos = {}
         self.upload_timeout = tk.IntVar(value=300)
         
         # Scanning settings variables
-        self.stability_timeout = tk.IntVar(value=3)
-        self.recheck_interval = tk.IntVar(value=5)
-        self.max_attempts = tk.IntVar(value=10)
+        # Spinbox text; the spinboxes only accept digits, so these always parse as ints
+        self.stability_timeout = tk.StringVar(value="3")
+        self.recheck_interval = tk.StringVar(value="5")
+        self.max_attempts = tk.StringVar(value="10")
+        
+        # get_* results are rebuilt only after one of the variables behind them changes
+        self._settings_cache = {}
+        self._settings_generation = 0  # Bumped on every invalidation
+        self._suspend_traces = False
+        for var in (self.upload_timeout,
+                    self.stability_timeout, self.recheck_interval, self.max_attempts):
+            var.trace_add('write', self._invalidate_settings_cache)
+        
+        self._fb_help_ref = None  # weak reference to the open Facebook help window
+        
+        # API tests run on one worker thread, started on the first test; results come back via a queue
+        self._api_test_queue = queue.Queue()
+        self._api_result_queue = queue.Queue()
+        self._api_test_thread = None
+        self._api_tests_pending = 0
         
         # Create GUI components
         self.create_widgets()
         
+    def _invalidate_settings_cache(self, *args):
+        """Drop cached get_* results after a settings variable is written"""
+        if self._suspend_traces:
+            return
+        self._settings_generation += 1
+        self._settings_cache.clear()
+        
+    def _on_platform_setting_changed(self, *args):
+        """Invalidate cached settings and let the rest of the app know platforms changed"""
+        if self._suspend_traces:
+            return
+        self._settings_generation += 1
+        self._settings_cache.clear()
+        self.app.notify_config_changed()
+        
+    @contextmanager
+    def _suspended_traces(self):
+        """Batch many variable writes into one cache invalidation and one change notification"""
+        self._suspend_traces = True
+        try:
+            yield
+        finally:
+            self._suspend_traces = False
+            self._on_platform_setting_changed()
+            
+    def _cached(self, key, build):
+        """Return a cached settings view, building it on first use after a change"""
+        try:
+            return self._settings_cache[key]
+        except KeyError:
+            # Worker threads build views too; if a setting changed meanwhile, don't cache the stale one
+            generation = self._settings_generation
+            value = build()
+            if generation == self._settings_generation:
+                self._settings_cache[key] = value
+            return value
+            
     def create_widgets(self):
-        """Create all GUI widgets for the settings tab"""
+        """Create the scrollable container; the sections are built the first time the tab is shown"""
         # Create scrollable frame
         canvas = tk.Canvas(self.frame)
         scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
         scrollbar.pack(side="right", fill="y")
         
+        self.canvas = canvas
+        self.scrollable_frame = scrollable_frame
+        self._digits_vcmd = (self.frame.register(_is_digits), '%P')
+        self._sections_built = False
+        self._map_binding = self.frame.bind("<Map>", self._build_sections)
+        
+    def _update_scrollregion(self):
+        """Fit the canvas scroll region to the settings content"""
+        # Finish any pending geometry work first so bbox sees the final size
+        self.scrollable_frame.update_idletasks()
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        
+    def _build_sections(self, event=None):
+        """Build the settings sections on first reveal of the tab"""
+        if self._sections_built:
+            return
+        self._sections_built = True
+        self.frame.unbind("<Map>", self._map_binding)
+        scrollable_frame = self.scrollable_frame
+        
         # Platform Configuration Section
         platform_frame = ttk.LabelFrame(scrollable_frame, text="Platform Configuration", padding=10)
         platform_frame.pack(fill='x', pady=5)
         
-        self.create_cloudflare_section(platform_frame)
-        self.create_youtube_section(platform_frame)
-        self.create_pinterest_section(platform_frame)
-        self.create_facebook_section(platform_frame)
+        for section in _PLATFORM_SECTIONS:
+            self._build_platform_section(platform_frame, section)
         
         # General Settings Section
         general_frame = ttk.LabelFrame(scrollable_frame, text="General Settings", padding=10)
         general_frame.pack(fill='x', pady=10)
         
-        self.create_general_section(general_frame)
+        self._build_setting_rows(general_frame, _GENERAL_ROWS)
         
         # Scanning Settings Section
         scanning_frame = ttk.LabelFrame(scrollable_frame, text="Auto-Scanning Settings", padding=10)
         scanning_frame.pack(fill='x', pady=10)
         
-        self.create_scanning_section(scanning_frame)
+        self._build_setting_rows(scanning_frame, _SCANNING_ROWS)
         
         # Action buttons
         button_frame = ttk.Frame(scrollable_frame)
@@ -93,258 +397,164 @@ class SettingsTab:
         ttk.Button(button_frame, text="Load Defaults", command=self.load_defaults).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Test All APIs", command=self.test_all_apis).pack(side='left', padx=5)
         
-    def create_cloudflare_section(self, parent):
-        """Create CloudFlare configuration section"""
-        cf_frame = ttk.Frame(parent)
-        cf_frame.pack(fill='x', pady=5)
-        
-        # Enable checkbox
-        cf_check = ttk.Checkbutton(cf_frame, text="CloudFlare Stream", 
-                                 variable=self.cloudflare_enabled)
-        cf_check.pack(anchor='w')
+        # Only embed the frame once it is fully populated, so the canvas lays it out in one pass
+        self.canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        # The content is fixed once built, so the scroll region only needs computing after its first layout
+        self.frame.after_idle(self._update_scrollregion)
         
-        # API fields
-        fields_frame = ttk.Frame(cf_frame)
-        fields_frame.pack(fill='x', padx=20, pady=5)
+    def _build_platform_section(self, parent, section):
+        """Build one platform's enable checkbox and credential rows from its table entry"""
+        title, enabled_var, fields, note = section
         
-        # API Token
-        token_frame = ttk.Frame(fields_frame)
-        token_frame.pack(fill='x', pady=2)
-        ttk.Label(token_frame, text="API Token:", width=15).pack(side='left')
-        token_entry = ttk.Entry(token_frame, textvariable=self.cloudflare_token, width=40, show='*')
-        token_entry.pack(side='left', padx=5)
-        ttk.Button(token_frame, text="Test", 
-                  command=lambda: self.test_api('cloudflare')).pack(side='left', padx=5)
-        
-        # Account ID
-        account_frame = ttk.Frame(fields_frame)
-        account_frame.pack(fill='x', pady=2)
-        ttk.Label(account_frame, text="Account ID:", width=15).pack(side='left')
-        ttk.Entry(account_frame, textvariable=self.cloudflare_account, width=40).pack(side='left', padx=5)
-        
-    def create_youtube_section(self, parent):
-        """Create YouTube configuration section"""
-        yt_frame = ttk.Frame(parent)
-        yt_frame.pack(fill='x', pady=5)
+        section_frame = ttk.Frame(parent)
+        section_frame.pack(fill='x', pady=5)
         
         # Enable checkbox
-        yt_check = ttk.Checkbutton(yt_frame, text="YouTube", 
-                                 variable=self.youtube_enabled)
-        yt_check.pack(anchor='w')
+        ttk.Checkbutton(section_frame, text=title, 
+                        variable=getattr(self, enabled_var)).pack(anchor='w')
         
-        # API fields
-        fields_frame = ttk.Frame(yt_frame)
+        # API fields, one grid row per field
+        fields_frame = ttk.Frame(section_frame)
         fields_frame.pack(fill='x', padx=20, pady=5)
         
-        # Client ID
-        client_frame = ttk.Frame(fields_frame)
-        client_frame.pack(fill='x', pady=2)
-        ttk.Label(client_frame, text="Client ID:", width=15).pack(side='left')
-        ttk.Entry(client_frame, textvariable=self.youtube_client_id, width=40).pack(side='left', padx=5)
-        ttk.Button(client_frame, text="Auth", 
-                  command=lambda: self.youtube_auth()).pack(side='left', padx=5)
-        
-        # Client Secret
-        secret_frame = ttk.Frame(fields_frame)
-        secret_frame.pack(fill='x', pady=2)
-        ttk.Label(secret_frame, text="Client Secret:", width=15).pack(side='left')
-        ttk.Entry(secret_frame, textvariable=self.youtube_client_secret, width=40, show='*').pack(side='left', padx=5)
-        
-        # Refresh Token
-        refresh_frame = ttk.Frame(fields_frame)
-        refresh_frame.pack(fill='x', pady=2)
-        ttk.Label(refresh_frame, text="Refresh Token:", width=15).pack(side='left')
-        refresh_entry = ttk.Entry(refresh_frame, textvariable=self.youtube_refresh_token, 
-                                width=40, state='readonly')
-        refresh_entry.pack(side='left', padx=5)
-        ttk.Label(refresh_frame, text="Auto-generated").pack(side='left', padx=5)
-        
-    def create_pinterest_section(self, parent):
-        """Create Pinterest configuration section"""
-        pin_frame = ttk.Frame(parent)
-        pin_frame.pack(fill='x', pady=5)
-        
-        # Enable checkbox
-        pin_check = ttk.Checkbutton(pin_frame, text="Pinterest", 
-                                  variable=self.pinterest_enabled)
-        pin_check.pack(anchor='w')
-        
-        # API fields
-        fields_frame = ttk.Frame(pin_frame)
-        fields_frame.pack(fill='x', padx=20, pady=5)
-        
-        # Access Token
-        token_frame = ttk.Frame(fields_frame)
-        token_frame.pack(fill='x', pady=2)
-        ttk.Label(token_frame, text="Access Token:", width=15).pack(side='left')
-        token_entry = ttk.Entry(token_frame, textvariable=self.pinterest_token, width=40, show='*')
-        token_entry.pack(side='left', padx=5)
-        ttk.Button(token_frame, text="Test", 
-                  command=lambda: self.test_api('pinterest')).pack(side='left', padx=5)
-        
-        # Board ID
-        board_frame = ttk.Frame(fields_frame)
-        board_frame.pack(fill='x', pady=2)
-        ttk.Label(board_frame, text="Board ID:", width=15).pack(side='left')
-        ttk.Entry(board_frame, textvariable=self.pinterest_board_id, width=40).pack(side='left', padx=5)
-        
-    def create_facebook_section(self, parent):
-        """Create Facebook configuration section"""
-        fb_frame = ttk.Frame(parent)
-        fb_frame.pack(fill='x', pady=5)
-        
-        # Enable checkbox
-        fb_check = ttk.Checkbutton(fb_frame, text="Facebook", 
-                                 variable=self.facebook_enabled)
-        fb_check.pack(anchor='w')
-        
-        # API fields
-        fields_frame = ttk.Frame(fb_frame)
-        fields_frame.pack(fill='x', padx=20, pady=5)
-        
-        # Page Token
-        token_frame = ttk.Frame(fields_frame)
-        token_frame.pack(fill='x', pady=2)
-        ttk.Label(token_frame, text="Access Token:", width=15).pack(side='left')
-        token_entry = ttk.Entry(token_frame, textvariable=self.facebook_token, width=35, show='*')
-        token_entry.pack(side='left', padx=5)
-        ttk.Button(token_frame, text="Test", 
-                  command=lambda: self.test_api('facebook')).pack(side='left', padx=2)
-        ttk.Button(token_frame, text="Help", 
-                  command=self.show_facebook_help).pack(side='left', padx=2)
-        
-        # Group ID
-        group_frame = ttk.Frame(fields_frame)
-        group_frame.pack(fill='x', pady=2)
-        ttk.Label(group_frame, text="Group ID:", width=15).pack(side='left')
-        ttk.Entry(group_frame, textvariable=self.facebook_group_id, width=40).pack(side='left', padx=5)
-        
-        # Permissions info
-        info_frame = ttk.Frame(fields_frame)
-        info_frame.pack(fill='x', pady=(5, 0))
-        info_label = ttk.Label(info_frame, text="ℹ️ Requires: publish_to_groups + groups_access_member_info permissions", 
-                              font=('TkDefaultFont', 8), foreground='#666666')
-        info_label.pack(anchor='w')
-        
-    def create_general_section(self, parent):
-        """Create general settings section"""
-        # Max Concurrent Uploads
-        concurrent_frame = ttk.Frame(parent)
-        concurrent_frame.pack(fill='x', pady=2)
-        ttk.Label(concurrent_frame, text="Max Concurrent Uploads:", width=25).pack(side='left')
-        concurrent_combo = ttk.Combobox(concurrent_frame, textvariable=self.max_concurrent, 
-                                      values=[1, 2, 3, 4, 5], width=10, state='readonly')
-        concurrent_combo.pack(side='left', padx=5)
-        
-        # Retry Attempts
-        retry_frame = ttk.Frame(parent)
-        retry_frame.pack(fill='x', pady=2)
-        ttk.Label(retry_frame, text="Retry Attempts:", width=25).pack(side='left')
-        retry_combo = ttk.Combobox(retry_frame, textvariable=self.retry_attempts, 
-                                 values=[1, 2, 3, 4, 5], width=10, state='readonly')
-        retry_combo.pack(side='left', padx=5)
-        
-        # Upload Timeout
-        timeout_frame = ttk.Frame(parent)
-        timeout_frame.pack(fill='x', pady=2)
-        ttk.Label(timeout_frame, text="Upload Timeout (seconds):", width=25).pack(side='left')
-        ttk.Entry(timeout_frame, textvariable=self.upload_timeout, width=10).pack(side='left', padx=5)
-        
-    def create_scanning_section(self, parent):
-        """Create scanning settings section"""
-        # File stability timeout
-        stability_frame = ttk.Frame(parent)
-        stability_frame.pack(fill='x', pady=2)
-        ttk.Label(stability_frame, text="File stability timeout:", width=25).pack(side='left')
-        stability_spin = ttk.Spinbox(stability_frame, from_=1, to=10, width=10, 
-                                    textvariable=self.stability_timeout)
-        stability_spin.pack(side='left', padx=5)
-        ttk.Label(stability_frame, text="seconds").pack(side='left', padx=5)
-        
-        # Text file check interval
-        recheck_frame = ttk.Frame(parent)
-        recheck_frame.pack(fill='x', pady=2)
-        ttk.Label(recheck_frame, text="Text file recheck interval:", width=25).pack(side='left')
-        recheck_spin = ttk.Spinbox(recheck_frame, from_=1, to=30, width=10, 
-                                  textvariable=self.recheck_interval)
-        recheck_spin.pack(side='left', padx=5)
-        ttk.Label(recheck_frame, text="minutes").pack(side='left', padx=5)
-        
-        # Max recheck attempts
-        attempts_frame = ttk.Frame(parent)
-        attempts_frame.pack(fill='x', pady=2)
-        ttk.Label(attempts_frame, text="Max recheck attempts:", width=25).pack(side='left')
-        attempts_spin = ttk.Spinbox(attempts_frame, from_=1, to=50, width=10, 
-                                   textvariable=self.max_attempts)
-        attempts_spin.pack(side='left', padx=5)
-        ttk.Label(attempts_frame, text="attempts").pack(side='left', padx=5)
-        
-    def test_api(self, platform):
-        """Test API connection for a specific platform"""
-        def test_worker():
-            import sys
-            from io import StringIO
+        for row, (label, var_name, entry_options, extras) in enumerate(fields):
+            ttk.Label(fields_frame, text=label, width=15).grid(row=row, column=0, sticky='w', pady=2)
+            entry_options = dict(entry_options)
+            entry_class = PasswordEntry if entry_options.pop('password', False) else ttk.Entry
+            entry_class(fields_frame, textvariable=getattr(self, var_name), 
+                        **entry_options).grid(row=row, column=1, sticky='w', padx=5)
             
-            # Capture print output to show detailed error messages
-            old_stdout = sys.stdout
-            captured_output = StringIO()
-            sys.stdout = captured_output
+            for column, (text, method, arg) in enumerate(extras, start=2):
+                if method is None:
+                    widget = ttk.Label(fields_frame, text=text)
+                else:
+                    command = getattr(self, method)
+                    if arg is not None:
+                        command = partial(command, arg)
+                    widget = ttk.Button(fields_frame, text=text, command=command)
+                widget.grid(row=row, column=column, sticky='w', padx=2)
+                
+        if note:
+            ttk.Label(fields_frame, text=note, font=('TkDefaultFont', 8), 
+                      foreground='#666666').grid(row=len(fields), column=0, columnspan=4, sticky='w', pady=(5, 0))
+            
+    def _on_choice_selected(self, name, event):
+        """Store a readonly combobox pick as a plain int"""
+        setattr(self, name, int(event.widget.get()))
+        self._invalidate_settings_cache()
+        
+    def set_choice(self, name, value):
+        """Set a readonly combobox setting, updating its widget if the section is built"""
+        setattr(self, name, int(value))
+        combo = self._choice_combos.get(name)
+        if combo is not None:
+            combo.set(value)
+        self._invalidate_settings_cache()
+        
+    def _build_setting_rows(self, parent, rows):
+        """Build label/widget/unit rows for the general and scanning sections"""
+        for row, (label, var_name, kind, choices, unit) in enumerate(rows):
+            ttk.Label(parent, text=label, width=25).grid(row=row, column=0, sticky='w', pady=2)
+            
+            if kind == 'combo':
+                widget = ttk.Combobox(parent, values=choices, width=10, state='readonly')
+                widget.set(getattr(self, var_name))
+                widget.bind('<<ComboboxSelected>>', partial(self._on_choice_selected, var_name))
+                self._choice_combos[var_name] = widget
+            elif kind == 'spin':
+                widget = ttk.Spinbox(parent, from_=choices[0], to=choices[1], width=10, 
+                                     textvariable=getattr(self, var_name),
+                                     validate='key', validatecommand=self._digits_vcmd)
+            else:
+                widget = ttk.Entry(parent, textvariable=getattr(self, var_name), width=10)
+            widget.grid(row=row, column=1, sticky='w', padx=5)
             
+            if unit:
+                ttk.Label(parent, text=unit).grid(row=row, column=2, sticky='w', padx=5)
+                
+    def _run_api_test(self, platform):
+        """Run one platform's connection test and return (success, message) without showing dialogs"""
+        result = False
+        error = None
+        
+        # Capture print output to show detailed error messages
+        with _capture_stdout() as captured_output:
             try:
                 if platform == 'cloudflare':
-                    from api.cloudflare import CloudFlareAPI
-                    api = CloudFlareAPI(self.cloudflare_token.get(), self.cloudflare_account.get())
+                    api = _api_class('cloudflare')(self.cloudflare_token.get(), self.cloudflare_account.get())
                     result = api.test_connection()
                     
                 elif platform == 'pinterest':
-                    from api.pinterest import PinterestAPI
-                    api = PinterestAPI(self.pinterest_token.get())
+                    api = _api_class('pinterest')(self.pinterest_token.get())
                     result = api.test_connection()
                     
                 elif platform == 'facebook':
-                    from api.facebook import FacebookAPI
-                    api = FacebookAPI(self.facebook_token.get(), self.facebook_group_id.get())
+                    api = _api_class('facebook')(self.facebook_token.get(), self.facebook_group_id.get())
                     result = api.test_connection()
                     
-                else:
-                    result = False
-                
-                # Restore stdout
-                sys.stdout = old_stdout
-                output_messages = captured_output.getvalue()
-                
-                if result:
-                    success_msg = f"{platform.title()} API connection successful!"
-                    if output_messages.strip():
-                        success_msg += f"\n\nDetails:\n{output_messages.strip()}"
-                    messagebox.showinfo("Success", success_msg)
-                else:
-                    error_msg = f"{platform.title()} API connection failed!"
-                    if output_messages.strip():
-                        error_msg += f"\n\nDetails:\n{output_messages.strip()}"
-                    else:
-                        error_msg += "\n\nPlease check your credentials and try again."
-                    messagebox.showerror("Error", error_msg)
-                    
             except Exception as e:
-                # Restore stdout in case of exception
-                sys.stdout = old_stdout
-                output_messages = captured_output.getvalue()
+                error = e
                 
-                error_msg = f"{platform.title()} API test failed: {str(e)}"
-                if output_messages.strip():
-                    error_msg += f"\n\nDetails:\n{output_messages.strip()}"
-                messagebox.showerror("Error", error_msg)
+        output_messages = captured_output.getvalue().strip()
+        details = f"\n\nDetails:\n{output_messages}" if output_messages else ""
+        
+        if error is not None:
+            return False, f"{platform.title()} API test failed: {str(error)}{details}"
+        if result:
+            return True, f"{platform.title()} API connection successful!{details}"
+        return False, (f"{platform.title()} API connection failed!" + 
+                       (details or "\n\nPlease check your credentials and try again."))
+        
+    def _show_test_result(self, success, message):
+        """Show an API test outcome (GUI thread only)"""
+        if success:
+            messagebox.showinfo("Success", message)
+        else:
+            messagebox.showerror("Error", message)
+            
+    def _submit_api_test(self, job):
+        """Queue a test job for the shared worker thread and poll for its result"""
+        if self._api_test_thread is None:
+            self._api_test_thread = threading.Thread(target=self._api_test_loop, daemon=True)
+            self._api_test_thread.start()
+            
+        self._api_tests_pending += 1
+        self._api_test_queue.put(job)
+        if self._api_tests_pending == 1:
+            self.frame.after(100, self._poll_api_results)
+            
+    def _api_test_loop(self):
+        """Run queued test jobs one after another on a single long-lived thread"""
+        while True:
+            job = self._api_test_queue.get()
+            try:
+                outcome = job()
+            except Exception as e:
+                outcome = (False, f"API test failed: {str(e)}")
+            self._api_result_queue.put(outcome)
+            
+    def _poll_api_results(self):
+        """Show finished test results on the Tk thread, polling while tests are outstanding"""
+        while True:
+            try:
+                outcome = self._api_result_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._api_tests_pending -= 1
+            if outcome is not None:
+                self._show_test_result(*outcome)
                 
-        # Run test in background thread
-        test_thread = threading.Thread(target=test_worker, daemon=True)
-        test_thread.start()
+        if self._api_tests_pending:
+            self.frame.after(100, self._poll_api_results)
+            
+    def test_api(self, platform):
+        """Test API connection for a specific platform"""
+        self._submit_api_test(partial(self._run_api_test, platform))
         
     def youtube_auth(self):
         """Handle YouTube OAuth authentication"""
         try:
-            from api.youtube import YouTubeAPI
-            api = YouTubeAPI(self.youtube_client_id.get(), self.youtube_client_secret.get())
+            api = _api_class('youtube')(self.youtube_client_id.get(), self.youtube_client_secret.get())
             refresh_token = api.authenticate()
             
             if refresh_token:
@@ -357,160 +567,70 @@ class SettingsTab:
             messagebox.showerror("Error", f"YouTube authentication error: {str(e)}")
             
     def test_all_apis(self):
-        """Test all enabled API connections"""
-        def test_all_worker():
-            enabled_platforms = self.get_enabled_platforms()
-            results = []
-            
-            for platform in enabled_platforms:
-                try:
-                    if platform == 'cloudflare':
-                        self.test_api('cloudflare')
-                    elif platform == 'youtube':
-                        # YouTube requires special handling for OAuth
-                        results.append(f"YouTube: OAuth token present")
-                    elif platform == 'pinterest':
-                        self.test_api('pinterest')
-                    elif platform == 'facebook':
-                        self.test_api('facebook')
-                except Exception as e:
-                    results.append(f"{platform}: {str(e)}")
-                    
-        test_thread = threading.Thread(target=test_all_worker, daemon=True)
-        test_thread.start()
+        """Test all enabled API connections in parallel and report them in one dialog"""
+        self._submit_api_test(self._run_all_api_tests)
+        
+    def _run_all_api_tests(self):
+        """Fan the enabled platforms' tests out in parallel; returns one combined (success, message)"""
+        enabled_platforms = list(self.get_enabled_platforms())
+        testable = [platform for platform in enabled_platforms if platform != 'youtube']
+        
+        outcomes = {}
+        if testable:
+            with ThreadPoolExecutor(max_workers=len(testable)) as executor:
+                outcomes = dict(zip(testable, executor.map(self._run_api_test, testable)))
+                
+        results = []
+        all_ok = True
+        for platform in enabled_platforms:
+            if platform == 'youtube':
+                # YouTube requires special handling for OAuth
+                results.append("YouTube: OAuth token present")
+            else:
+                success, message = outcomes[platform]
+                all_ok = all_ok and success
+                results.append(message)
+                
+        if not results:
+            return None
+        return all_ok, "\n\n".join(results)
     
     def show_facebook_help(self):
         """Show Facebook permissions help dialog"""
+        # Reuse the window if it is still open
+        help_window = self._fb_help_ref() if self._fb_help_ref is not None else None
+        if help_window is not None and help_window.winfo_exists():
+            help_window.deiconify()
+            help_window.lift()
+            help_window.focus_set()
+            return
+            
         help_window = tk.Toplevel(self.frame)
+        self._fb_help_ref = weakref.ref(help_window)
         help_window.title("Facebook API Setup Help")
         help_window.geometry("700x600")
         help_window.resizable(True, True)
         
-        # Make it modal
+        # Non-modal, so credentials can be pasted in while the guide stays open
         help_window.transient(self.frame)
-        help_window.grab_set()
+        help_window.protocol('WM_DELETE_WINDOW', help_window.destroy)
         
         # Create scrollable text widget
         text_frame = ttk.Frame(help_window)
         text_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Text widget with scrollbar
-        text_widget = tk.Text(text_frame, wrap='word', font=('Consolas', 9), padx=10, pady=10)
+        # Static, read-only content: no undo bookkeeping for the insert
+        text_widget = tk.Text(text_frame, wrap='word', font=('Consolas', 9), padx=10, pady=10,
+                              undo=False, autoseparators=False, maxundo=0)
         scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
         
         text_widget.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
         
-        # Help content
-        help_text = """📋 FACEBOOK API PERMISSIONS SETUP GUIDE
-
-🔥 PROBLEM: Your Facebook token only has READ permissions!
-✅ SOLUTION: Get a token with WRITE permissions for video uploads.
-
-═══════════════════════════════════════════════════════════════
-
-🔑 REQUIRED PERMISSIONS:
-   • publish_to_groups - Post content to Facebook groups
-   • groups_access_member_info - Access group information
-
-📱 STEP-BY-STEP INSTRUCTIONS:
-
-1. 📖 Go to Facebook Graph API Explorer:
-   https://developers.facebook.com/tools/explorer/
-
-2. 🏗️ Create or Select Your App:
-   • If you don't have an app, create one at:
-     https://developers.facebook.com/apps/
-   • Select your app from the dropdown in Graph API Explorer
-
-3. 🎯 Generate Access Token:
-   • Click "Generate Access Token"
-   • Add these specific permissions:
-     ✓ publish_to_groups
-     ✓ groups_access_member_info
-   
-4. 👤 Important User Requirements:
-   • You must be logged in as a user who is:
-     ✓ A member of the target Facebook group
-     ✓ Has permission to post in the group
-     ✓ Preferably an admin/moderator of the group
-
-5. 📋 Copy the Generated Token:
-   • Copy the access token from Graph API Explorer
-   • Paste it into the "Access Token" field above
-
-═══════════════════════════════════════════════════════════════
-
-🛠️ ALTERNATIVE: PAGE ACCESS TOKEN
-
-If you want to post as a Facebook Page:
-
-1. Get a Page Access Token instead of User Access Token
-2. Required permissions:
-   • pages_manage_posts
-   • pages_read_engagement
-3. The page must be connected to/admin of the group
-
-═══════════════════════════════════════════════════════════════
-
-⚠️ COMMON ISSUES:
-
-❌ "Access forbidden" error:
-   → Your token lacks write permissions
-   → Regenerate token with publish_to_groups permission
-
-❌ "Group not found" error:
-   → Check your Group ID is correct
-   → Make sure you're a member of the group
-
-❌ "Upload forbidden" error:
-   → Group settings may restrict video uploads
-   → You may need admin approval for posts
-   → Check if you're banned/restricted in the group
-
-❌ "Invalid token" error:
-   → Token may have expired
-   → Regenerate a new access token
-
-═══════════════════════════════════════════════════════════════
-
-🔍 HOW TO FIND YOUR GROUP ID:
-
-1. Go to your Facebook group
-2. Look at the URL: facebook.com/groups/[GROUP_ID]
-3. Or use Graph API Explorer:
-   • Search: me/groups
-   • Find your group in the results
-
-═══════════════════════════════════════════════════════════════
-
-💡 TESTING TIPS:
-
-✅ Use the "Test" button to verify:
-   • Token permissions are correct
-   • You can access the group
-   • Video upload permissions work
-
-✅ If test passes, you're ready to upload videos!
-
-═══════════════════════════════════════════════════════════════
-
-🔐 SECURITY NOTE:
-
-• Keep your access token private
-• Tokens can expire - you may need to regenerate them
-• Use User tokens for personal posting
-• Use Page tokens for business/page posting
-
-═══════════════════════════════════════════════════════════════
-
-Need more help? Check Facebook's Developer Documentation:
-https://developers.facebook.com/docs/graph-api/reference/group/videos/
-"""
-        
         # Insert help text
-        text_widget.insert('1.0', help_text)
+        text_widget.insert('1.0', _FACEBOOK_HELP_TEXT)
         text_widget.config(state='disabled')  # Make read-only
         
         # Close button
@@ -519,7 +639,7 @@ https://developers.facebook.com/docs/graph-api/reference/group/videos/
         
         ttk.Button(button_frame, text="Close", command=help_window.destroy).pack(side='right')
         ttk.Button(button_frame, text="Open Graph API Explorer", 
-                  command=lambda: self.open_url("https://developers.facebook.com/tools/explorer/")).pack(side='right', padx=(0, 5))
+                  command=partial(self.open_url, "https://developers.facebook.com/tools/explorer/")).pack(side='right', padx=(0, 5))
         
         # Center the window
         help_window.update_idletasks()
@@ -529,7 +649,6 @@ https://developers.facebook.com/docs/graph-api/reference/group/videos/
     
     def open_url(self, url):
         """Open URL in default browser"""
-        import webbrowser
         webbrowser.open(url)
         
     def save_settings(self):
@@ -542,64 +661,51 @@ https://developers.facebook.com/docs/graph-api/reference/group/videos/
             
     def load_defaults(self):
         """Load default settings"""
-        self.cloudflare_enabled.set(True)
-        self.youtube_enabled.set(True)
-        self.pinterest_enabled.set(False)
-        self.facebook_enabled.set(True)
-        
-        self.max_concurrent.set(3)
-        self.retry_attempts.set(3)
-        self.upload_timeout.set(300)
-        
-        # Scanning defaults
-        self.stability_timeout.set(3)
-        self.recheck_interval.set(5)
-        self.max_attempts.set(10)
-        
-        # Clear credentials
-        self.cloudflare_token.set("")
-        self.cloudflare_account.set("")
-        self.youtube_client_id.set("")
-        self.youtube_client_secret.set("")
-        self.youtube_refresh_token.set("")
-        self.pinterest_token.set("")
-        self.pinterest_board_id.set("")
-        self.facebook_token.set("")
-        self.facebook_group_id.set("")
+        # Apply everything, then invalidate and notify once
+        with self._suspended_traces():
+            self.cloudflare_enabled.set(True)
+            self.youtube_enabled.set(True)
+            self.pinterest_enabled.set(False)
+            self.facebook_enabled.set(True)
+            
+            self.set_choice('max_concurrent', 3)
+            self.set_choice('retry_attempts', 3)
+            self.upload_timeout.set(300)
+            
+            # Scanning defaults
+            self.stability_timeout.set(3)
+            self.recheck_interval.set(5)
+            self.max_attempts.set(10)
+            
+            # Clear credentials
+            self.cloudflare_token.set("")
+            self.cloudflare_account.set("")
+            self.youtube_client_id.set("")
+            self.youtube_client_secret.set("")
+            self.youtube_refresh_token.set("")
+            self.pinterest_token.set("")
+            self.pinterest_board_id.set("")
+            self.facebook_token.set("")
+            self.facebook_group_id.set("")
         
     def get_enabled_platforms(self):
         """Get dictionary of enabled platforms with their credentials"""
-        enabled = {}
+        return self._cached('enabled_platforms', self._build_enabled_platforms)
         
-        if self.cloudflare_enabled.get() and self.cloudflare_token.get():
-            enabled['cloudflare'] = {
-                'api_token': self.cloudflare_token.get(),
-                'account_id': self.cloudflare_account.get()
-            }
-            
-        if self.youtube_enabled.get() and self.youtube_client_id.get():
-            enabled['youtube'] = {
-                'client_id': self.youtube_client_id.get(),
-                'client_secret': self.youtube_client_secret.get(),
-                'refresh_token': self.youtube_refresh_token.get()
-            }
-            
-        if self.pinterest_enabled.get() and self.pinterest_token.get():
-            enabled['pinterest'] = {
-                'access_token': self.pinterest_token.get(),
-                'board_id': self.pinterest_board_id.get()
-            }
-            
-        if self.facebook_enabled.get() and self.facebook_token.get():
-            enabled['facebook'] = {
-                'page_token': self.facebook_token.get(),
-                'group_id': self.facebook_group_id.get()
-            }
-            
-        return enabled
+    def _build_enabled_platforms(self):
+        """Derive the enabled platforms and their credentials from the platform settings in one pass"""
+        return {
+            platform: {key: value for key, value in fields.items() if key != 'enabled'}
+            for platform, fields in self.get_settings().items()
+            if fields['enabled'] and fields[_REQUIRED_CREDENTIAL[platform]]
+        }
         
     def get_settings(self):
         """Get platform settings for saving"""
+        return self._cached('settings', self._build_settings)
+        
+    def _build_settings(self):
+        """Read the platform settings from the Tk variables"""
         return {
             'cloudflare': {
                 'enabled': self.cloudflare_enabled.get(),
@@ -626,70 +732,76 @@ https://developers.facebook.com/docs/graph-api/reference/group/videos/
         
     def get_general_settings(self):
         """Get general settings for saving"""
+        return self._cached('general', self._build_general_settings)
+        
+    def _build_general_settings(self):
+        """Read the general settings from the Tk variables"""
         return {
-            'max_concurrent': self.max_concurrent.get(),
-            'retry_attempts': self.retry_attempts.get(),
+            'max_concurrent': self.get_max_concurrent(),
+            'retry_attempts': self.retry_attempts,
             'upload_timeout': self.upload_timeout.get(),
-            'scanning': {
-                'stability_timeout': self.stability_timeout.get(),
-                'recheck_interval': self.recheck_interval.get(),
-                'max_attempts': self.max_attempts.get()
-            }
+            'scanning': self.get_scanning_settings()
         }
         
     def get_max_concurrent(self):
         """Get max concurrent uploads setting"""
-        return self.max_concurrent.get()
+        return self.max_concurrent
         
     def get_scanning_settings(self):
         """Get scanning settings"""
+        return self._cached('scanning', self._build_scanning_settings)
+        
+    def _build_scanning_settings(self):
+        """Read the scanning settings from the Tk variables"""
         return {
-            'stability_timeout': self.stability_timeout.get(),
-            'recheck_interval': self.recheck_interval.get(),
-            'max_attempts': self.max_attempts.get()
+            # A cleared spinbox falls back to its minimum of 1
+            'stability_timeout': int(self.stability_timeout.get() or 1),
+            'recheck_interval': int(self.recheck_interval.get() or 1),
+            'max_attempts': int(self.max_attempts.get() or 1)
         }
         
     def load_settings(self, settings):
         """Load settings from configuration"""
         try:
-            platforms = settings.get('platforms', {})
-            
-            # CloudFlare
-            cf = platforms.get('cloudflare', {})
-            self.cloudflare_enabled.set(cf.get('enabled', True))
-            self.cloudflare_token.set(cf.get('api_token', ''))
-            self.cloudflare_account.set(cf.get('account_id', ''))
-            
-            # YouTube
-            yt = platforms.get('youtube', {})
-            self.youtube_enabled.set(yt.get('enabled', True))
-            self.youtube_client_id.set(yt.get('client_id', ''))
-            self.youtube_client_secret.set(yt.get('client_secret', ''))
-            self.youtube_refresh_token.set(yt.get('refresh_token', ''))
-            
-            # Pinterest
-            pin = platforms.get('pinterest', {})
-            self.pinterest_enabled.set(pin.get('enabled', False))
-            self.pinterest_token.set(pin.get('access_token', ''))
-            self.pinterest_board_id.set(pin.get('board_id', ''))
-            
-            # Facebook
-            fb = platforms.get('facebook', {})
-            self.facebook_enabled.set(fb.get('enabled', True))
-            self.facebook_token.set(fb.get('page_token', ''))
-            self.facebook_group_id.set(fb.get('group_id', ''))
-            
-            # General settings
-            general = settings.get('general', {})
-            self.max_concurrent.set(general.get('max_concurrent', 3))
-            self.retry_attempts.set(general.get('retry_attempts', 3))
-            self.upload_timeout.set(general.get('upload_timeout', 300))
-            
-            # Scanning settings
-            scanning = general.get('scanning', {})
-            self.stability_timeout.set(scanning.get('stability_timeout', 3))
-            self.recheck_interval.set(scanning.get('recheck_interval', 5))
-            self.max_attempts.set(scanning.get('max_attempts', 10))
+            with self._suspended_traces():
+                platforms = settings.get('platforms', {})
+                
+                # CloudFlare
+                cf = platforms.get('cloudflare', {})
+                self.cloudflare_enabled.set(cf.get('enabled', True))
+                self.cloudflare_token.set(cf.get('api_token', ''))
+                self.cloudflare_account.set(cf.get('account_id', ''))
+                
+                # YouTube
+                yt = platforms.get('youtube', {})
+                self.youtube_enabled.set(yt.get('enabled', True))
+                self.youtube_client_id.set(yt.get('client_id', ''))
+                self.youtube_client_secret.set(yt.get('client_secret', ''))
+                self.youtube_refresh_token.set(yt.get('refresh_token', ''))
+                
+                # Pinterest
+                pin = platforms.get('pinterest', {})
+                self.pinterest_enabled.set(pin.get('enabled', False))
+                self.pinterest_token.set(pin.get('access_token', ''))
+                self.pinterest_board_id.set(pin.get('board_id', ''))
+                
+                # Facebook
+                fb = platforms.get('facebook', {})
+                self.facebook_enabled.set(fb.get('enabled', True))
+                self.facebook_token.set(fb.get('page_token', ''))
+                self.facebook_group_id.set(fb.get('group_id', ''))
+                
+                # General settings
+                general = settings.get('general', {})
+                self.set_choice('max_concurrent', general.get('max_concurrent', 3))
+                self.set_choice('retry_attempts', general.get('retry_attempts', 3))
+                self.upload_timeout.set(general.get('upload_timeout', 300))
+                
+                # Scanning settings
+                scanning = general.get('scanning', {})
+                self.stability_timeout.set(scanning.get('stability_timeout', 3))
+                self.recheck_interval.set(scanning.get('recheck_interval', 5))
+                self.max_attempts.set(scanning.get('max_attempts', 10))
             
         except Exception as e:
             print(f"Error loading settings: {e}") 
\ No newline at end of file
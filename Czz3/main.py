@@ -8,6 +8,8 @@ from tkinter import ttk, messagebox
 import sys
 import os
 import json
+import logging
+import logging.handlers
 import threading
 from pathlib import Path
 
@@ -34,6 +36,7 @@ class VideoUploadApp:
         # Initialize components
         self.file_manager = None
         self.upload_manager = None
+        self._config_listeners = []
         
         # Create GUI
         self.create_notebook()
@@ -131,6 +134,15 @@ class VideoUploadApp:
         """Get list of enabled platforms"""
         return self.settings_tab.get_enabled_platforms()
         
+    def add_config_listener(self, callback):
+        """Register a callback to run when platform settings change"""
+        self._config_listeners.append(callback)
+        
+    def notify_config_changed(self):
+        """Tell listeners that platform settings changed"""
+        for callback in self._config_listeners:
+            callback()
+        
     def get_upload_manager(self):
         """Get or create upload manager"""
         if not self.upload_manager:
@@ -155,6 +167,8 @@ class VideoUploadApp:
             # Stop any running uploads
             if self.upload_manager:
                 self.upload_manager.abort_all()
+                # Write out queued status files and stop the writer thread
+                self.upload_manager.status_tracker.close(timeout=5)
                 
             # Save settings
             self.save_settings()
@@ -162,11 +176,42 @@ class VideoUploadApp:
         except Exception as e:
             print(f"Error during shutdown: {e}")
         finally:
+            # Write out log records still sitting in the buffer
+            for handler in logging.getLogger().handlers:
+                handler.flush()
             self.root.destroy()
 
+def setup_logging():
+    """Send module logging to a buffered log file, with warnings and errors on the console too"""
+    try:
+        log_dir = project_root / "logs"
+        log_dir.mkdir(exist_ok=True)
+        
+        file_handler = logging.FileHandler(log_dir / "upload_automation.log", encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+        
+        # Flush every 256 records, or immediately on a warning/error
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=256, flushLevel=logging.WARNING, target=file_handler
+        )
+        
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(buffered_handler)
+        
+        # Problems still show on the console, like the prints they replaced (pythonw has none)
+        if sys.stderr is not None:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.WARNING)
+            console_handler.setFormatter(logging.Formatter('%(levelname)s %(name)s: %(message)s'))
+            root_logger.addHandler(console_handler)
+    except Exception as e:
+        print(f"Error setting up logging: {e}")
+
 def main():
     """Application entry point"""
     try:
+        setup_logging()
         app = VideoUploadApp()
         app.root.protocol("WM_DELETE_WINDOW", app.on_closing)
         app.root.mainloop()